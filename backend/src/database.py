@@ -4,63 +4,309 @@ Handles SQLite operations for tags, cache, and settings
 Uses standard library sqlite3 with asyncio.to_thread for async operations
 """
 
+import re
 import sqlite3
 import asyncio
 import time
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 
 # Use Decky's built-in logger
 import decky
 logger = decky.logger
 
+# Hot per-appid statements. Kept as module constants so the exact same SQL text
+# is submitted every time, letting sqlite3's per-connection statement cache
+# reuse the compiled statement instead of re-preparing it.
+# is_manual is aliased with a [BOOLEAN] type hint so sqlite3 (PARSE_COLNAMES)
+# returns it as a Python bool via the converter registered below
+_SQL_GET_TAG = """
+    SELECT appid, tag, is_manual AS "is_manual [BOOLEAN]", last_updated
+    FROM game_tags WHERE appid = ?
+"""
+
+_SQL_GET_ALL_TAGS = """
+    SELECT appid, tag, is_manual AS "is_manual [BOOLEAN]", last_updated
+    FROM game_tags
+"""
+
+_SQL_UPSERT_TAG = """
+    INSERT INTO game_tags (appid, tag, is_manual, last_updated)
+    VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT(appid) DO UPDATE SET
+        tag = excluded.tag,
+        is_manual = excluded.is_manual,
+        last_updated = CURRENT_TIMESTAMP
+"""
+
+_SQL_UPSERT_HLTB = """
+    INSERT INTO hltb_cache (
+        appid, game_name, matched_name, similarity_score,
+        main_story, main_extra, completionist, all_styles,
+        hltb_url, cached_at
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, CAST(strftime('%s', 'now') AS INTEGER))
+    ON CONFLICT(appid) DO UPDATE SET
+        game_name = excluded.game_name,
+        matched_name = excluded.matched_name,
+        similarity_score = excluded.similarity_score,
+        main_story = excluded.main_story,
+        main_extra = excluded.main_extra,
+        completionist = excluded.completionist,
+        all_styles = excluded.all_styles,
+        hltb_url = excluded.hltb_url,
+        cached_at = excluded.cached_at
+"""
+
+# cached_at is unix epoch seconds; expiry is checked in SQL
+_SQL_GET_HLTB = "SELECT * FROM hltb_cache WHERE appid = ? AND cached_at > ?"
+
+_SQL_UPSERT_STATS = """
+    INSERT INTO game_stats (
+        appid, game_name, playtime_minutes,
+        total_achievements, unlocked_achievements, is_hidden, rt_last_time_played, last_sync
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT(appid) DO UPDATE SET
+        game_name = excluded.game_name,
+        playtime_minutes = excluded.playtime_minutes,
+        total_achievements = excluded.total_achievements,
+        unlocked_achievements = excluded.unlocked_achievements,
+        is_hidden = excluded.is_hidden,
+        rt_last_time_played = excluded.rt_last_time_played,
+        last_sync = CURRENT_TIMESTAMP
+"""
+
+_SQL_GET_STATS = "SELECT * FROM game_stats WHERE appid = ?"
+
+# Bulk lookups for a whole library sync; "{}" is filled with one "?" per appid
+_SQL_GET_TAGS_IN = """
+    SELECT appid, tag, is_manual AS "is_manual [BOOLEAN]", last_updated
+    FROM game_tags WHERE appid IN ({})
+"""
+_SQL_GET_HLTB_IN = "SELECT * FROM hltb_cache WHERE appid IN ({}) AND cached_at > ?"
+_SQL_GET_STATS_IN = "SELECT * FROM game_stats WHERE appid IN ({})"
+
+# Appids bound into one IN (...) query; SQLite builds before 3.32 allow at
+# most 999 variables per statement
+IN_QUERY_CHUNK_SIZE = 500
+
+_SQL_COUNT_VISIBLE_TAGS = """
+    SELECT gt.tag, COUNT(*)
+    FROM game_tags gt
+    LEFT JOIN game_stats gs ON gs.appid = gt.appid
+    WHERE gs.is_hidden = 0 OR gs.is_hidden IS NULL
+    GROUP BY gt.tag
+"""
+
+# Visible games without a tag (the backlog), in one anti-join
+_SQL_GET_BACKLOG = """
+    SELECT gs.appid, gs.game_name
+    FROM game_stats gs
+    LEFT JOIN game_tags gt ON gt.appid = gs.appid
+    WHERE gt.appid IS NULL AND (gs.is_hidden = 0 OR gs.is_hidden IS NULL)
+    ORDER BY LOWER(gs.game_name)
+"""
+
+_SQL_COUNT_VISIBLE_GAMES = "SELECT COUNT(*) FROM game_stats WHERE is_hidden = 0 OR is_hidden IS NULL"
+
+_SQL_UPSERT_SETTING = """
+    INSERT INTO settings (key, value)
+    VALUES (?, ?)
+    ON CONFLICT(key) DO UPDATE SET value = excluded.value
+"""
+
+# Size of sqlite3's per-connection prepared statement cache
+STATEMENT_CACHE_SIZE = 256
+
+# Read-only connections used alongside the writer connection. With WAL,
+# lookups on these don't wait behind a commit in progress on the writer
+READER_POOL_SIZE = 2
+
+# Tags a game can be stored with (backlog is the absence of a tag)
+VALID_TAGS = frozenset({'completed', 'in_progress', 'mastered', 'dropped'})
+
+# Automated tag writes are queued and committed together, at most this long
+# after the first queued write or as soon as this many are pending
+TAG_FLUSH_DELAY = 0.05
+TAG_FLUSH_MAX_PENDING = 100
+
+# Default HLTB cache lifetime (cache_ttl setting), in seconds.
+# Keep in sync with the default row inserted by _init_schema_sync
+DEFAULT_HLTB_CACHE_TTL = 2 * 3600
+
+# Decode columns tagged "[BOOLEAN]" straight to bool inside the driver
+sqlite3.register_converter("BOOLEAN", lambda value: value == b"1")
+
+
+def _setting_to_bool(value: str) -> bool:
+    # set_setting always stores booleans as lowercase 'true'/'false'
+    return value == 'true'
+
+
+# Known settings and their types, so reads don't have to sniff the value
+_SETTING_TYPES = {
+    'auto_tag_enabled': _setting_to_bool,
+    'in_progress_threshold': float,
+    'cache_ttl': float,
+    'mastered_multiplier': float,
+    'source_installed': _setting_to_bool,
+    'source_non_steam': _setting_to_bool,
+    'source_all_owned': _setting_to_bool,
+}
+
+
+_NUMERIC_RE = re.compile(r'^-?\d+(\.\d+)?$')
+
+
+def _sniff_setting_value(value: str) -> Any:
+    """Guess the type of a setting that isn't in _SETTING_TYPES"""
+    lowered = value.lower()
+    if lowered in ('true', 'false'):
+        return lowered == 'true'
+    # Check with a regex instead of letting float() raise for every string
+    return float(value) if _NUMERIC_RE.match(value) else value
+
+
+def _convert_setting(key: str, value: str) -> Any:
+    """Convert a stored setting string to its Python value"""
+    converter = _SETTING_TYPES.get(key)
+    if converter is None:
+        return _sniff_setting_value(value)
+    # Only a malformed stored value (e.g. hand-edited or written by an old
+    # version) raises here; keep it as a string rather than fail every read,
+    # including the cache_ttl lookup in init_database
+    try:
+        return converter(value)
+    except ValueError:
+        return value
+
+
+def _hltb_cache_ttl(value: Any) -> int:
+    """HLTB cache TTL in seconds from the cache_ttl setting, default if unset or malformed"""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return int(value)
+    return DEFAULT_HLTB_CACHE_TTL
+
 
 class Database:
     def __init__(self, db_path: str):
         self.db_path = db_path
         self.connection: Optional[sqlite3.Connection] = None
+        # appid -> tag row queued by queue_tag but not yet committed
+        self._pending_tags: Dict[str, Dict[str, Any]] = {}
+        # Tags taken off the queue by the flush that hasn't committed yet
+        self._flushing_tags: Dict[str, Dict[str, Any]] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        # Held by the flush in progress, so later flush() calls wait for it
+        self._flush_lock = asyncio.Lock()
+        # Converted settings, loaded on first read and dropped by set_setting;
+        # the version tells a load in progress that a write made it stale
+        self._settings_cache: Optional[Dict[str, Any]] = None
+        self._settings_version = 0
+        # cache_ttl setting, read by init_database and kept in sync by set_setting
+        self.hltb_cache_ttl = DEFAULT_HLTB_CACHE_TTL
+        # Idle reader connections, see READER_POOL_SIZE
+        self._readers: Optional[asyncio.Queue] = None
+        # Held for every use of the writer connection; see _write
+        self._write_lock = asyncio.Lock()
 
     def _connect_sync(self):
         """Synchronous connection for use with to_thread"""
         # check_same_thread=False allows connection to be used across threads
-        # This is safe because we serialize access through asyncio.to_thread
-        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        # This is safe because _write serializes every use of this connection
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            cached_statements=STATEMENT_CACHE_SIZE,
+            # Column-name hints only; PARSE_DECLTYPES would also turn the
+            # TIMESTAMP columns into datetime objects
+            detect_types=sqlite3.PARSE_COLNAMES
+        )
         conn.row_factory = sqlite3.Row
+
+        # WAL + NORMAL sync avoids a full fsync on every commit (eMMC on Deck is slow)
+        conn.executescript("""
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-65536;      -- 64 MiB page cache
+            PRAGMA mmap_size=268435456;    -- 256 MiB mmap read path
+            PRAGMA busy_timeout=3000;
+        """)
+        return conn
+
+    def _connect_reader_sync(self):
+        """Synchronous read-only connection for the reader pool"""
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            cached_statements=STATEMENT_CACHE_SIZE,
+            detect_types=sqlite3.PARSE_COLNAMES
+        )
+        conn.row_factory = sqlite3.Row
+
+        # journal_mode=WAL is persistent and already set by the writer
+        conn.executescript("""
+            PRAGMA query_only=ON;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-16384;      -- 16 MiB page cache
+            PRAGMA mmap_size=268435456;    -- 256 MiB mmap read path
+            PRAGMA busy_timeout=3000;
+        """)
         return conn
 
     async def connect(self):
         """Establish database connection"""
         self.connection = await asyncio.to_thread(self._connect_sync)
+        readers = await asyncio.gather(*(
+            asyncio.to_thread(self._connect_reader_sync) for _ in range(READER_POOL_SIZE)
+        ))
+        self._readers = asyncio.Queue()
+        for reader in readers:
+            self._readers.put_nowait(reader)
         logger.info(f"Connected to database: {self.db_path}")
 
+    def _close_sync(self, conn):
+        # Let SQLite refresh planner statistics so the next session starts current
+        try:
+            conn.execute("PRAGMA optimize")
+        except sqlite3.Error as e:
+            logger.warning(f"PRAGMA optimize failed: {e}")
+        conn.close()
+
     async def close(self):
         """Close database connection"""
+        if self._flush_task and not self._flush_task.done():
+            # Let an in-flight flush finish rather than closing under it
+            await self._flush_task
         if self.connection:
-            await asyncio.to_thread(self.connection.close)
+            await self.flush()
+            while self._readers is not None and not self._readers.empty():
+                await asyncio.to_thread(self._readers.get_nowait().close)
+            await self._write(self._close_sync)
             logger.info("Database connection closed")
 
     def _init_schema_sync(self, conn):
         """Synchronous schema initialization"""
-        cursor = conn.cursor()
+        # One-off DDL goes through executescript, which bypasses the statement
+        # cache, so it doesn't evict the hot per-appid statements
+        conn.executescript("""
+            BEGIN;
 
-        cursor.execute("""
             CREATE TABLE IF NOT EXISTS game_tags (
                 appid TEXT PRIMARY KEY,
                 tag TEXT NOT NULL,
                 is_manual BOOLEAN DEFAULT 0,
                 last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
+            );
 
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_tags_tag ON game_tags(tag)
-        """)
+            -- game_tags is only ever read by appid (primary key) or in full, so
+            -- secondary indexes on tag/is_manual just add writes to every set_tag
+            DROP INDEX IF EXISTS idx_tags_tag;
 
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_tags_manual ON game_tags(is_manual)
-        """)
+            DROP INDEX IF EXISTS idx_tags_manual;
 
-        cursor.execute("""
             CREATE TABLE IF NOT EXISTS hltb_cache (
                 appid TEXT PRIMARY KEY,
                 game_name TEXT NOT NULL,
@@ -71,15 +317,19 @@ class Database:
                 completionist REAL,
                 all_styles REAL,
                 hltb_url TEXT,
-                cached_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
+                cached_at INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER))
+            );
 
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_hltb_cached_at ON hltb_cache(cached_at)
-        """)
+            -- Migration: cached_at used to be written as a CURRENT_TIMESTAMP string,
+            -- which the TTL check could never compare, so those rows never
+            -- expired. Start their TTL now rather than purging them on upgrade.
+            UPDATE hltb_cache
+            SET cached_at = CAST(strftime('%s', 'now') AS INTEGER)
+            WHERE typeof(cached_at) = 'text';
+
+            -- Serves the startup purge of expired rows
+            CREATE INDEX IF NOT EXISTS idx_hltb_cached_at ON hltb_cache(cached_at);
 
-        cursor.execute("""
             CREATE TABLE IF NOT EXISTS game_stats (
                 appid TEXT PRIMARY KEY,
                 game_name TEXT NOT NULL,
@@ -89,92 +339,267 @@ class Database:
                 is_hidden BOOLEAN DEFAULT 0,
                 rt_last_time_played INTEGER,
                 last_sync TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-
-        # Migration: Add is_hidden column if it doesn't exist
-        cursor.execute("PRAGMA table_info(game_stats)")
-        columns = [col[1] for col in cursor.fetchall()]
-        if 'is_hidden' not in columns:
-            cursor.execute("ALTER TABLE game_stats ADD COLUMN is_hidden BOOLEAN DEFAULT 0")
-        if 'rt_last_time_played' not in columns:
-            cursor.execute("ALTER TABLE game_stats ADD COLUMN rt_last_time_played INTEGER")
+            );
 
-        cursor.execute("""
             CREATE TABLE IF NOT EXISTS settings (
                 key TEXT PRIMARY KEY,
                 value TEXT NOT NULL
-            )
-        """)
+            );
 
-        # Insert default settings
-        # Note: mastered_multiplier is no longer used (mastered = 100% achievements)
-        cursor.execute("""
+            -- Insert default settings
+            -- Note: mastered_multiplier is no longer used (mastered = 100% achievements)
             INSERT OR IGNORE INTO settings (key, value) VALUES
                 ('auto_tag_enabled', 'true'),
                 ('in_progress_threshold', '30'),
-                ('cache_ttl', '7200'),
+                ('cache_ttl', '7200'),  -- DEFAULT_HLTB_CACHE_TTL
                 ('source_installed', 'true'),
                 ('source_non_steam', 'true'),
-                ('source_all_owned', 'true')
+                ('source_all_owned', 'true');
+
+            COMMIT;
         """)
 
-        conn.commit()
+        # Migration: Add is_hidden column if it doesn't exist
+        columns = [col[1] for col in conn.execute("PRAGMA table_info(game_stats)").fetchall()]
+        if 'is_hidden' not in columns:
+            conn.executescript("ALTER TABLE game_stats ADD COLUMN is_hidden BOOLEAN DEFAULT 0")
+        if 'rt_last_time_played' not in columns:
+            conn.executescript("ALTER TABLE game_stats ADD COLUMN rt_last_time_played INTEGER")
 
     async def init_database(self):
         """Initialize database schema"""
         if not self.connection:
             await self.connect()
 
-        await asyncio.to_thread(self._init_schema_sync, self.connection)
+        await self._write(self._init_schema_sync)
         logger.info("Database schema initialized")
 
-    # Tag operations
-    def _get_tag_sync(self, conn, appid: str):
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM game_tags WHERE appid = ?", (appid,))
-        return cursor.fetchone()
+        # Read once; reads and the purge below all expire rows by this TTL
+        self.hltb_cache_ttl = _hltb_cache_ttl(await self.get_setting('cache_ttl'))
+        purged = await self.purge_expired_hltb_cache()
+        if purged:
+            logger.info(f"Purged {purged} expired HLTB cache entries")
 
+        # Touch the hot tables so first lookups hit the page cache, not eMMC
+        await self._fetchone("SELECT count(*) FROM game_tags")
+        await self._fetchone("SELECT count(*) FROM hltb_cache")
+
+    # Query helpers: execute + fetch in a single worker-thread hop
+    def _execute_fetchone_sync(self, conn, sql: str, params: tuple = ()):
+        return conn.execute(sql, params).fetchone()
+
+    def _execute_fetchall_sync(self, conn, sql: str, params: tuple = ()):
+        return conn.execute(sql, params).fetchall()
+
+    async def _write(self, fn, *args):
+        """Run a write helper on the writer connection, one call at a time
+
+        Concurrent syncs would otherwise interleave statements from different
+        transactions on the shared connection.
+        """
+        async with self._write_lock:
+            return await asyncio.to_thread(fn, self.connection, *args)
+
+    async def _read(self, fn, *args):
+        """Run a read-only query helper on an idle reader connection"""
+        conn = await self._readers.get()
+        try:
+            return await asyncio.to_thread(fn, conn, *args)
+        finally:
+            self._readers.put_nowait(conn)
+
+    async def _fetchone(self, sql: str, params: tuple = ()) -> Optional[sqlite3.Row]:
+        return await self._read(self._execute_fetchone_sync, sql, params)
+
+    async def _fetchall(self, sql: str, params: tuple = ()) -> List[sqlite3.Row]:
+        return await self._read(self._execute_fetchall_sync, sql, params)
+
+    def _fetch_by_appids_sync(self, conn, sql: str, appids: List[str], params: tuple = ()):
+        # Full chunks share the same SQL text, so they reuse one cached statement
+        rows = []
+        for start in range(0, len(appids), IN_QUERY_CHUNK_SIZE):
+            chunk = appids[start:start + IN_QUERY_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            rows.extend(conn.execute(sql.format(placeholders), (*chunk, *params)).fetchall())
+        return rows
+
+    async def _fetch_by_appids(self, sql: str, appids: List[str], params: tuple = ()) -> List[sqlite3.Row]:
+        """Fetch rows for many appids in one worker-thread hop"""
+        if not appids:
+            return []
+        return await self._read(self._fetch_by_appids_sync, sql, appids, params)
+
+    # Tag operations
     async def get_tag(self, appid: str) -> Optional[Dict[str, Any]]:
         """Get tag for a specific game"""
         if not self.connection:
             return None
 
-        row = await asyncio.to_thread(self._get_tag_sync, self.connection, appid)
+        # Readers only see committed rows, so answer from the queue until then
+        pending = self._pending_tags.get(appid) or self._flushing_tags.get(appid)
+        if pending:
+            return dict(pending)
+
+        row = await self._fetchone(_SQL_GET_TAG, (appid,))
 
         if row:
             return {
                 "appid": row["appid"],
                 "tag": row["tag"],
-                "is_manual": bool(row["is_manual"]),
+                "is_manual": row["is_manual"],
                 "last_updated": row["last_updated"]
             }
         return None
 
+    async def get_tags_many(self, appids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get tags for many games, keyed by appid (untagged games are absent)"""
+        if not self.connection:
+            return {}
+
+        rows = await self._fetch_by_appids(_SQL_GET_TAGS_IN, appids)
+        tags = {
+            appid: {
+                "appid": appid,
+                "tag": tag,
+                "is_manual": is_manual,
+                "last_updated": last_updated
+            }
+            for appid, tag, is_manual, last_updated in rows
+        }
+
+        # Queued writes win over the committed rows, as in get_tag
+        if self._flushing_tags or self._pending_tags:
+            wanted = set(appids)
+            for queued in (self._flushing_tags, self._pending_tags):
+                for appid, entry in queued.items():
+                    if appid in wanted:
+                        tags[appid] = dict(entry)
+        return tags
+
     def _set_tag_sync(self, conn, appid: str, tag: str, is_manual: bool):
         cursor = conn.cursor()
-        cursor.execute("""
-            INSERT INTO game_tags (appid, tag, is_manual, last_updated)
-            VALUES (?, ?, ?, CURRENT_TIMESTAMP)
-            ON CONFLICT(appid) DO UPDATE SET
-                tag = excluded.tag,
-                is_manual = excluded.is_manual,
-                last_updated = CURRENT_TIMESTAMP
-        """, (appid, tag, int(is_manual)))
+        cursor.execute(_SQL_UPSERT_TAG, (appid, tag, is_manual))
         conn.commit()
 
+    def _is_valid_tag_write(self, appid: str, tag: str) -> bool:
+        """Reject bad input before it costs a round-trip to the DB thread"""
+        if tag not in VALID_TAGS:
+            logger.error(f"Refusing to store invalid tag {tag!r} for {appid}")
+            return False
+        if not appid.isdigit():
+            logger.error(f"Refusing to store tag for invalid appid {appid!r}")
+            return False
+        return True
+
+    def _drop_queued_tag(self, appid: str):
+        """Forget a queued write superseded by a direct one
+
+        Also drops it from a flush in progress, so get_tag stops answering
+        with it; that flush commits before the direct write (see _write).
+        """
+        self._pending_tags.pop(appid, None)
+        self._flushing_tags.pop(appid, None)
+
     async def set_tag(self, appid: str, tag: str, is_manual: bool = False) -> bool:
         """Set or update tag for a game"""
-        if not self.connection:
+        if not self.connection or not self._is_valid_tag_write(appid, tag):
             return False
 
+        # This write supersedes anything still queued for the game
+        self._drop_queued_tag(appid)
+
         try:
-            await asyncio.to_thread(self._set_tag_sync, self.connection, appid, tag, is_manual)
+            await self._write(self._set_tag_sync, appid, tag, is_manual)
             return True
         except Exception as e:
             logger.error(f"Failed to set tag for {appid}: {e}")
             return False
 
+    async def bulk_set_tag(self, appids: List[str], tag: str, is_manual: bool = False) -> int:
+        """Set the same tag on many games in a single transaction
+
+        Returns the number of games written (0 on failure).
+        """
+        if not self.connection:
+            return 0
+
+        rows = [(appid, tag, is_manual) for appid in appids if self._is_valid_tag_write(appid, tag)]
+        if not rows:
+            return 0
+
+        # These writes supersede anything still queued for the same games
+        for appid, _, _ in rows:
+            self._drop_queued_tag(appid)
+
+        try:
+            await self._write(self._set_tags_many_sync, rows)
+            return len(rows)
+        except Exception as e:
+            logger.error(f"Failed to set tag {tag} for {len(rows)} games: {e}")
+            return 0
+
+    async def queue_tag(self, appid: str, tag: str, is_manual: bool = False) -> bool:
+        """Queue a tag write to be committed together with other queued writes
+
+        Used for bulk automated tagging so a library sync doesn't pay one commit
+        per game. get_tag sees queued writes immediately; everything else that
+        reads game_tags flushes the queue first.
+        """
+        if not self.connection or not self._is_valid_tag_write(appid, tag):
+            return False
+
+        self._pending_tags[appid] = {
+            "appid": appid,
+            "tag": tag,
+            "is_manual": is_manual,
+            "last_updated": time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime())
+        }
+
+        if len(self._pending_tags) >= TAG_FLUSH_MAX_PENDING:
+            return await self.flush()
+
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._delayed_flush())
+        return True
+
+    async def _delayed_flush(self):
+        await asyncio.sleep(TAG_FLUSH_DELAY)
+        await self.flush()
+
+    def _set_tags_many_sync(self, conn, rows: List[tuple]):
+        with conn:
+            conn.executemany(_SQL_UPSERT_TAG, rows)
+
+    async def flush(self) -> bool:
+        """Commit all queued tag writes in a single transaction
+
+        Waits for a flush already in progress, so once this returns every tag
+        queued before the call is committed. On failure the tags are queued
+        again and False is returned.
+        """
+        if not self.connection or (not self._pending_tags and not self._flush_lock.locked()):
+            return True
+
+        async with self._flush_lock:
+            if not self._pending_tags:
+                return True
+
+            pending, self._pending_tags = self._pending_tags, {}
+            self._flushing_tags = pending
+            rows = [(appid, entry["tag"], entry["is_manual"]) for appid, entry in pending.items()]
+
+            try:
+                await self._write(self._set_tags_many_sync, rows)
+                return True
+            except Exception as e:
+                logger.error(f"Failed to write {len(rows)} queued tags: {e}")
+                # Requeue what a direct write hasn't superseded meanwhile;
+                # tags queued since then are newer and win
+                self._pending_tags = {**self._flushing_tags, **self._pending_tags}
+                return False
+            finally:
+                self._flushing_tags = {}
+
     def _remove_tag_sync(self, conn, appid: str):
         cursor = conn.cursor()
         cursor.execute("DELETE FROM game_tags WHERE appid = ?", (appid,))
@@ -185,56 +610,37 @@ class Database:
         if not self.connection:
             return False
 
+        self._drop_queued_tag(appid)
+
         try:
-            await asyncio.to_thread(self._remove_tag_sync, self.connection, appid)
+            await self._write(self._remove_tag_sync, appid)
             return True
         except Exception as e:
             logger.error(f"Failed to remove tag for {appid}: {e}")
             return False
 
-    def _get_all_tags_sync(self, conn):
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM game_tags")
-        return cursor.fetchall()
-
     async def get_all_tags(self) -> List[Dict[str, Any]]:
         """Get all game tags"""
         if not self.connection:
             return []
 
-        rows = await asyncio.to_thread(self._get_all_tags_sync, self.connection)
+        await self.flush()
+        rows = await self._fetchall(_SQL_GET_ALL_TAGS)
 
+        # Unpack rows positionally instead of four name lookups per sqlite3.Row
         return [
             {
-                "appid": row["appid"],
-                "tag": row["tag"],
-                "is_manual": bool(row["is_manual"]),
-                "last_updated": row["last_updated"]
+                "appid": appid,
+                "tag": tag,
+                "is_manual": is_manual,
+                "last_updated": last_updated
             }
-            for row in rows
+            for appid, tag, is_manual, last_updated in rows
         ]
 
     # HLTB cache operations
-    def _cache_hltb_sync(self, conn, appid: str, data: Dict[str, Any]):
-        cursor = conn.cursor()
-        cursor.execute("""
-            INSERT INTO hltb_cache (
-                appid, game_name, matched_name, similarity_score,
-                main_story, main_extra, completionist, all_styles,
-                hltb_url, cached_at
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-            ON CONFLICT(appid) DO UPDATE SET
-                game_name = excluded.game_name,
-                matched_name = excluded.matched_name,
-                similarity_score = excluded.similarity_score,
-                main_story = excluded.main_story,
-                main_extra = excluded.main_extra,
-                completionist = excluded.completionist,
-                all_styles = excluded.all_styles,
-                hltb_url = excluded.hltb_url,
-                cached_at = CURRENT_TIMESTAMP
-        """, (
+    def _hltb_params(self, appid: str, data: Dict[str, Any]) -> tuple:
+        return (
             appid,
             data.get("game_name"),
             data.get("matched_name"),
@@ -244,48 +650,33 @@ class Database:
             data.get("completionist"),
             data.get("all_styles"),
             data.get("hltb_url")
-        ))
-        conn.commit()
+        )
 
-    async def cache_hltb_data(self, appid: str, data: Dict[str, Any]) -> bool:
-        """Cache HowLongToBeat data"""
-        if not self.connection:
-            return False
-
-        try:
-            await asyncio.to_thread(self._cache_hltb_sync, self.connection, appid, data)
-            return True
-        except Exception as e:
-            logger.error(f"Failed to cache HLTB data for {appid}: {e}")
-            return False
-
-    def _get_hltb_cache_sync(self, conn, appid: str):
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM hltb_cache WHERE appid = ?", (appid,))
-        return cursor.fetchone()
-
-    async def get_hltb_cache(self, appid: str, ttl: int = 7200) -> Optional[Dict[str, Any]]:
-        """Get cached HLTB data if not expired"""
+    async def get_hltb_cache(self, appid: str, ttl: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """Get cached HLTB data if not expired (ttl defaults to the cache_ttl setting)"""
         if not self.connection:
             return None
 
-        row = await asyncio.to_thread(self._get_hltb_cache_sync, self.connection, appid)
+        row = await self._fetchone(_SQL_GET_HLTB, (appid, self._hltb_cutoff(ttl)))
 
         if not row:
             return None
 
-        # Check if cache is expired
-        cached_timestamp = row["cached_at"]
-        current_time = time.time()
+        return self._hltb_from_row(row)
 
-        try:
-            cached_time = float(cached_timestamp)
-        except (ValueError, TypeError):
-            cached_time = current_time
+    async def get_hltb_cache_many(self, appids: List[str], ttl: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+        """Get unexpired HLTB data for many games, keyed by appid"""
+        if not self.connection:
+            return {}
 
-        if current_time - cached_time > ttl:
-            return None
+        rows = await self._fetch_by_appids(_SQL_GET_HLTB_IN, appids, (self._hltb_cutoff(ttl),))
+        return {row["appid"]: self._hltb_from_row(row) for row in rows}
 
+    def _hltb_cutoff(self, ttl: Optional[int]) -> int:
+        """cached_at below which HLTB rows count as expired"""
+        return int(time.time()) - (self.hltb_cache_ttl if ttl is None else ttl)
+
+    def _hltb_from_row(self, row: sqlite3.Row) -> Dict[str, Any]:
         return {
             "appid": row["appid"],
             "game_name": row["game_name"],
@@ -298,24 +689,25 @@ class Database:
             "hltb_url": row["hltb_url"]
         }
 
+    def _purge_hltb_cache_sync(self, conn, cutoff: int) -> int:
+        cursor = conn.execute("DELETE FROM hltb_cache WHERE cached_at < ?", (cutoff,))
+        conn.commit()
+        return cursor.rowcount
+
+    async def purge_expired_hltb_cache(self, ttl: Optional[int] = None) -> int:
+        """Delete HLTB cache rows older than ttl seconds, returns rows removed"""
+        if not self.connection:
+            return 0
+
+        try:
+            return await self._write(self._purge_hltb_cache_sync, self._hltb_cutoff(ttl))
+        except Exception as e:
+            logger.error(f"Failed to purge expired HLTB cache: {e}")
+            return 0
+
     # Game stats operations
-    def _update_stats_sync(self, conn, appid: str, stats: Dict[str, Any]):
-        cursor = conn.cursor()
-        cursor.execute("""
-            INSERT INTO game_stats (
-                appid, game_name, playtime_minutes,
-                total_achievements, unlocked_achievements, is_hidden, rt_last_time_played, last_sync
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-            ON CONFLICT(appid) DO UPDATE SET
-                game_name = excluded.game_name,
-                playtime_minutes = excluded.playtime_minutes,
-                total_achievements = excluded.total_achievements,
-                unlocked_achievements = excluded.unlocked_achievements,
-                is_hidden = excluded.is_hidden,
-                rt_last_time_played = excluded.rt_last_time_played,
-                last_sync = CURRENT_TIMESTAMP
-        """, (
+    def _stats_params(self, appid: str, stats: Dict[str, Any]) -> tuple:
+        return (
             appid,
             stats.get("game_name", ""),
             stats.get("playtime_minutes", 0),
@@ -323,7 +715,11 @@ class Database:
             stats.get("unlocked_achievements", 0),
             int(stats.get("is_hidden", False)),
             stats.get("rt_last_time_played")
-        ))
+        )
+
+    def _update_stats_sync(self, conn, appid: str, stats: Dict[str, Any]):
+        cursor = conn.cursor()
+        cursor.execute(_SQL_UPSERT_STATS, self._stats_params(appid, stats))
         conn.commit()
 
     async def update_game_stats(self, appid: str, stats: Dict[str, Any]) -> bool:
@@ -332,95 +728,165 @@ class Database:
             return False
 
         try:
-            await asyncio.to_thread(self._update_stats_sync, self.connection, appid, stats)
+            await self._write(self._update_stats_sync, appid, stats)
             return True
         except Exception as e:
             logger.error(f"Failed to update stats for {appid}: {e}")
             return False
 
-    def _get_stats_sync(self, conn, appid: str):
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM game_stats WHERE appid = ?", (appid,))
-        return cursor.fetchone()
+    def _apply_sync_batch_sync(self, conn, stats_items: List[Tuple[str, Dict[str, Any]]],
+                               hltb_items: List[Tuple[str, Dict[str, Any]]]):
+        with conn:
+            if hltb_items:
+                conn.executemany(
+                    _SQL_UPSERT_HLTB,
+                    [self._hltb_params(appid, data) for appid, data in hltb_items]
+                )
+            if stats_items:
+                conn.executemany(
+                    _SQL_UPSERT_STATS,
+                    [self._stats_params(appid, stats) for appid, stats in stats_items]
+                )
+
+    async def apply_sync_batch(self, stats_items: List[Tuple[str, Dict[str, Any]]],
+                               hltb_items: List[Tuple[str, Dict[str, Any]]]) -> bool:
+        """Write a chunk of synced stats and HLTB rows in one transaction
+
+        A failing chunk is rolled back on its own; chunks already written stay.
+        """
+        if not self.connection:
+            return False
+        if not stats_items and not hltb_items:
+            return True
+
+        try:
+            await self._write(self._apply_sync_batch_sync, stats_items, hltb_items)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to save sync results for {len(stats_items)} games: {e}")
+            return False
+
+    def _apply_sync_result_sync(self, conn, appid: str, stats: Dict[str, Any],
+                                hltb: Optional[Dict[str, Any]], tag: Optional[str], is_manual: bool):
+        with conn:
+            conn.execute(_SQL_UPSERT_STATS, self._stats_params(appid, stats))
+            if hltb:
+                conn.execute(_SQL_UPSERT_HLTB, self._hltb_params(appid, hltb))
+            if tag:
+                conn.execute(_SQL_UPSERT_TAG, (appid, tag, is_manual))
+
+    async def apply_sync_result(self, appid: str, stats: Dict[str, Any],
+                                hltb: Optional[Dict[str, Any]] = None,
+                                tag: Optional[str] = None, is_manual: bool = False) -> bool:
+        """Write a game's stats, and optionally HLTB data and tag, in one transaction"""
+        if not self.connection:
+            return False
+        if tag and not self._is_valid_tag_write(appid, tag):
+            return False
+
+        if tag:
+            # This write supersedes anything still queued for the game
+            self._drop_queued_tag(appid)
+
+        try:
+            await self._write(self._apply_sync_result_sync, appid, stats, hltb, tag, is_manual)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to save sync result for {appid}: {e}")
+            return False
 
     async def get_game_stats(self, appid: str) -> Optional[Dict[str, Any]]:
         """Get game statistics"""
         if not self.connection:
             return None
 
-        row = await asyncio.to_thread(self._get_stats_sync, self.connection, appid)
+        row = await self._fetchone(_SQL_GET_STATS, (appid,))
 
         if row:
-            # Handle case where is_hidden column might not exist yet (migration)
-            try:
-                is_hidden = bool(row["is_hidden"])
-            except (KeyError, IndexError):
-                is_hidden = False
+            return self._stats_from_row(row)
+        return None
 
-            # Handle case where rt_last_time_played might not exist yet (migration)
-            try:
-                rt_last_time_played = row["rt_last_time_played"]
-            except (KeyError, IndexError):
-                rt_last_time_played = None
+    async def get_game_stats_many(self, appids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get statistics for many games, keyed by appid"""
+        if not self.connection:
+            return {}
 
-            return {
-                "appid": row["appid"],
-                "game_name": row["game_name"],
-                "playtime_minutes": row["playtime_minutes"],
-                "total_achievements": row["total_achievements"],
-                "unlocked_achievements": row["unlocked_achievements"],
-                "is_hidden": is_hidden,
-                "rt_last_time_played": rt_last_time_played,
-                "last_sync": row["last_sync"]
-            }
-        return None
+        rows = await self._fetch_by_appids(_SQL_GET_STATS_IN, appids)
+        return {row["appid"]: self._stats_from_row(row) for row in rows}
 
-    def _get_all_game_stats_sync(self, conn, include_hidden: bool = True):
-        cursor = conn.cursor()
-        if include_hidden:
-            cursor.execute("SELECT appid FROM game_stats")
-        else:
-            cursor.execute("SELECT appid FROM game_stats WHERE is_hidden = 0 OR is_hidden IS NULL")
-        return cursor.fetchall()
+    def _stats_from_row(self, row: sqlite3.Row) -> Dict[str, Any]:
+        # Handle case where is_hidden column might not exist yet (migration)
+        try:
+            is_hidden = bool(row["is_hidden"])
+        except (KeyError, IndexError):
+            is_hidden = False
+
+        # Handle case where rt_last_time_played might not exist yet (migration)
+        try:
+            rt_last_time_played = row["rt_last_time_played"]
+        except (KeyError, IndexError):
+            rt_last_time_played = None
+
+        return {
+            "appid": row["appid"],
+            "game_name": row["game_name"],
+            "playtime_minutes": row["playtime_minutes"],
+            "total_achievements": row["total_achievements"],
+            "unlocked_achievements": row["unlocked_achievements"],
+            "is_hidden": is_hidden,
+            "rt_last_time_played": rt_last_time_played,
+            "last_sync": row["last_sync"]
+        }
 
     async def get_all_game_stats(self, include_hidden: bool = True) -> List[Dict[str, Any]]:
         """Get all game statistics records (appid only for counting)"""
         if not self.connection:
             return []
 
-        rows = await asyncio.to_thread(self._get_all_game_stats_sync, self.connection, include_hidden)
+        if include_hidden:
+            rows = await self._fetchall("SELECT appid FROM game_stats")
+        else:
+            rows = await self._fetchall("SELECT appid FROM game_stats WHERE is_hidden = 0 OR is_hidden IS NULL")
         return [{"appid": row["appid"]} for row in rows]
 
-    # Settings operations
-    def _get_setting_sync(self, conn, key: str):
-        cursor = conn.cursor()
-        cursor.execute("SELECT value FROM settings WHERE key = ?", (key,))
-        return cursor.fetchone()
+    async def get_backlog_games(self) -> List[Dict[str, Any]]:
+        """Get appid and stored name of every visible game without a tag"""
+        if not self.connection:
+            return []
+
+        await self.flush()
+        rows = await self._fetchall(_SQL_GET_BACKLOG)
+        return [{"appid": appid, "game_name": game_name} for appid, game_name in rows]
+
+    async def get_tag_counts_visible(self) -> Dict[str, int]:
+        """Count tags per type, skipping hidden games (tags without stats count)"""
+        if not self.connection:
+            return {}
+
+        await self.flush()
+        rows = await self._fetchall(_SQL_COUNT_VISIBLE_TAGS)
+        return {tag: count for tag, count in rows}
 
+    async def get_visible_library_count(self) -> int:
+        """Number of games in game_stats that are not hidden"""
+        if not self.connection:
+            return 0
+
+        row = await self._fetchone(_SQL_COUNT_VISIBLE_GAMES)
+        return row[0] if row else 0
+
+    # Settings operations
     async def get_setting(self, key: str, default: Any = None) -> Any:
         """Get a setting value"""
         if not self.connection:
             return default
 
-        row = await asyncio.to_thread(self._get_setting_sync, self.connection, key)
-
-        if row:
-            value = row["value"]
-            if value.lower() in ('true', 'false'):
-                return value.lower() == 'true'
-            try:
-                return float(value)
-            except ValueError:
-                return value
-        return default
+        settings = await self._load_settings()
+        return settings.get(key, default)
 
     def _set_setting_sync(self, conn, key: str, value: str):
         cursor = conn.cursor()
-        cursor.execute("""
-            INSERT INTO settings (key, value)
-            VALUES (?, ?)
-            ON CONFLICT(key) DO UPDATE SET value = excluded.value
-        """, (key, value))
+        cursor.execute(_SQL_UPSERT_SETTING, (key, value))
         conn.commit()
 
     async def set_setting(self, key: str, value: Any) -> bool:
@@ -430,37 +896,39 @@ class Database:
 
         try:
             str_value = str(value).lower() if isinstance(value, bool) else str(value)
-            await asyncio.to_thread(self._set_setting_sync, self.connection, key, str_value)
+            await self._write(self._set_setting_sync, key, str_value)
+            self._settings_cache = None
+            self._settings_version += 1
+            if key == 'cache_ttl':
+                self.hltb_cache_ttl = _hltb_cache_ttl(_convert_setting(key, str_value))
             return True
         except Exception as e:
             logger.error(f"Failed to set setting {key}: {e}")
             return False
 
-    def _get_all_settings_sync(self, conn):
-        cursor = conn.cursor()
-        cursor.execute("SELECT key, value FROM settings")
-        return cursor.fetchall()
-
     async def get_all_settings(self) -> Dict[str, Any]:
-        """Get all settings"""
+        """Get all settings
+
+        Settings are read for every tagged game during a sync but change only
+        through set_setting, so they are cached until the next write.
+        """
         if not self.connection:
             return {}
 
-        rows = await asyncio.to_thread(self._get_all_settings_sync, self.connection)
-
-        settings = {}
-        for row in rows:
-            key = row["key"]
-            value = row["value"]
+        # Callers get their own copy so the cache can't be modified through it
+        return dict(await self._load_settings())
 
-            if value.lower() in ('true', 'false'):
-                settings[key] = value.lower() == 'true'
-            else:
-                try:
-                    settings[key] = float(value)
-                except ValueError:
-                    settings[key] = value
+    async def _load_settings(self) -> Dict[str, Any]:
+        """The cached settings dict, loaded on first use; callers must not modify it"""
+        if self._settings_cache is not None:
+            return self._settings_cache
 
+        version = self._settings_version
+        rows = await self._fetchall("SELECT key, value FROM settings")
+        settings = {key: _convert_setting(key, value) for key, value in rows}
+        # Don't cache what was read if a set_setting landed meanwhile
+        if version == self._settings_version:
+            self._settings_cache = settings
         return settings
 
     def _get_games_eligible_for_dropped_sync(self, conn, days_threshold: int):
@@ -468,7 +936,6 @@ class Database:
         cursor = conn.cursor()
 
         # Calculate timestamp threshold (current time - days)
-        import time
         current_time = int(time.time())
         threshold_timestamp = current_time - (days_threshold * 24 * 60 * 60)
 
@@ -505,7 +972,8 @@ class Database:
         if not self.connection:
             return []
 
-        rows = await asyncio.to_thread(self._get_games_eligible_for_dropped_sync, self.connection, days_threshold)
+        await self.flush()
+        rows = await self._read(self._get_games_eligible_for_dropped_sync, days_threshold)
 
         return [
             {
@@ -5,13 +5,16 @@ Fetches game completion times from HowLongToBeat using standard library only
 
 import asyncio
 import json
+import re
 import ssl
+import threading
 import time
-import urllib.request
 import urllib.error
 from typing import Optional, Dict, Any, List
 from difflib import SequenceMatcher
 
+from http_client import KeepAliveClient
+
 # Create SSL context that doesn't verify certificates (Steam Deck may have cert issues)
 SSL_CONTEXT = ssl.create_default_context()
 SSL_CONTEXT.check_hostname = False
@@ -21,14 +24,52 @@ SSL_CONTEXT.verify_mode = ssl.CERT_NONE
 import decky
 logger = decky.logger
 
+# Minimum spacing between HLTB requests, shared by all concurrent callers
+HLTB_REQUEST_INTERVAL = 1.0
+
+# On HTTP 429/5xx every caller pauses (Retry-After if sent, else an
+# exponential delay from min to max) and the search is retried
+HLTB_RETRY_ATTEMPTS = 2
+HLTB_BACKOFF_MIN = 2.0
+HLTB_BACKOFF_MAX = 60.0
+
+# Name cleanup patterns for _sanitize_game_name, compiled once at import.
+# Common suffixes that don't help with matching, combined into one pattern
+_EDITION_SUFFIX_RE = re.compile(
+    r'\s*-\s*Steam Special Edition'
+    r'|\s*-\s*Special Edition'
+    r'|\s*-\s*Enhanced Edition'
+    r'|\s*-\s*Game of the Year'
+    r'|\s*-\s*GOTY'
+    r'|\s*-\s*Anniversary Edition'
+    r'|\s*-\s*Definitive Edition'
+    r'|\s*\([\d]{4}\)',  # Year in parentheses like (2008)
+    re.IGNORECASE
+)
+_SEPARATOR_RE = re.compile(r'[-:]+')
+_SPECIAL_CHAR_RE = re.compile(r'[^\w\s]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
 
 class HLTBService:
     def __init__(self):
         self.min_similarity = 0.7  # Minimum similarity threshold
         self.base_url = "https://howlongtobeat.com"
+        # Token and search requests reuse connections instead of a new
+        # TLS handshake per request
+        self._http = KeepAliveClient("howlongtobeat.com", SSL_CONTEXT, timeout=15)
         self.user_agent = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
         self.auth_token = None
         self.token_timestamp = 0
+        # Searches run concurrently on worker threads; serialize token refresh
+        self._token_lock = threading.Lock()
+        # Concurrent searches queue here so HLTB sees at most one request
+        # start per HLTB_REQUEST_INTERVAL (time.monotonic deadline)
+        self._rate_limit = asyncio.Lock()
+        self._next_request_at = 0.0
+        self._backoff = HLTB_BACKOFF_MIN
+        # game name -> task for a search in progress, shared by concurrent callers
+        self._inflight: Dict[str, asyncio.Task] = {}
 
     def _calculate_similarity(self, str1: str, str2: str) -> float:
         """Calculate string similarity using SequenceMatcher"""
@@ -38,7 +79,7 @@ class HLTBService:
         """Get auth token from HLTB finder/init endpoint"""
         try:
             timestamp = int(time.time() * 1000)
-            init_url = f"{self.base_url}/api/finder/init?t={timestamp}"
+            init_path = f"/api/finder/init?t={timestamp}"
 
             headers = {
                 "User-Agent": self.user_agent,
@@ -47,14 +88,17 @@ class HLTBService:
                 "Accept": "application/json",
             }
 
-            req = urllib.request.Request(init_url, headers=headers)
-
-            with urllib.request.urlopen(req, timeout=10, context=SSL_CONTEXT) as response:
-                result = json.loads(response.read().decode('utf-8'))
-                token = result.get('token')
-                if token:
-                    return token
+            _, body = self._http.request("GET", init_path, headers=headers)
+            result = json.loads(body)
+            token = result.get('token')
+            if token:
+                return token
 
+        except urllib.error.HTTPError as e:
+            if e.code == 429 or e.code >= 500:
+                # Throttled or overloaded: let search_game back off and retry
+                raise
+            logger.error(f"Failed to get HLTB auth token: {e}")
         except Exception as e:
             logger.error(f"Failed to get HLTB auth token: {e}")
 
@@ -63,28 +107,15 @@ class HLTBService:
     def _sanitize_game_name(self, game_name: str) -> str:
         """Sanitize game name for better HLTB search matching.
         Removes special characters that can interfere with search."""
-        import re
         # Remove common suffixes that don't help with matching
-        suffixes_to_remove = [
-            r'\s*-\s*Steam Special Edition',
-            r'\s*-\s*Special Edition',
-            r'\s*-\s*Enhanced Edition',
-            r'\s*-\s*Game of the Year',
-            r'\s*-\s*GOTY',
-            r'\s*-\s*Anniversary Edition',
-            r'\s*-\s*Definitive Edition',
-            r'\s*\([\d]{4}\)',  # Year in parentheses like (2008)
-        ]
-        result = game_name
-        for suffix in suffixes_to_remove:
-            result = re.sub(suffix, '', result, flags=re.IGNORECASE)
+        result = _EDITION_SUFFIX_RE.sub('', game_name)
 
         # Replace hyphens and colons with spaces (e.g., "Brothers - A Tale" -> "Brothers A Tale")
-        result = re.sub(r'[-:]+', ' ', result)
+        result = _SEPARATOR_RE.sub(' ', result)
         # Remove other special characters but keep alphanumeric and spaces
-        result = re.sub(r'[^\w\s]', '', result)
+        result = _SPECIAL_CHAR_RE.sub('', result)
         # Collapse multiple spaces
-        result = re.sub(r'\s+', ' ', result).strip()
+        result = _WHITESPACE_RE.sub(' ', result).strip()
 
         return result
 
@@ -92,10 +123,11 @@ class HLTBService:
         """Synchronous HLTB search"""
         try:
             # Get fresh auth token (tokens may expire)
-            current_time = time.time()
-            if not self.auth_token or (current_time - self.token_timestamp) > 300:  # Refresh every 5 min
-                self.auth_token = self._get_auth_token_sync()
-                self.token_timestamp = current_time
+            with self._token_lock:
+                current_time = time.time()
+                if not self.auth_token or (current_time - self.token_timestamp) > 300:  # Refresh every 5 min
+                    self.auth_token = self._get_auth_token_sync()
+                    self.token_timestamp = current_time
 
             if not self.auth_token:
                 logger.error("Could not get HLTB auth token")
@@ -140,12 +172,16 @@ class HLTBService:
             }
 
             data = json.dumps(payload).encode('utf-8')
-            url = f"{self.base_url}/api/finder"
-
-            req = urllib.request.Request(url, data=data, headers=headers, method='POST')
 
-            with urllib.request.urlopen(req, timeout=15, context=SSL_CONTEXT) as response:
-                result = json.loads(response.read().decode('utf-8'))
+            try:
+                _, body = self._http.request("POST", "/api/finder", body=data, headers=headers)
+                result = json.loads(body)
+            except urllib.error.HTTPError as e:
+                if e.code == 429 or e.code >= 500:
+                    # Throttled or overloaded: let search_game back off and retry
+                    raise
+                logger.error(f"HLTB search error: {e}")
+                return None
 
             games = result.get("data", [])
             if not games:
@@ -183,6 +219,9 @@ class HLTBService:
                 "hltb_url": f"https://howlongtobeat.com/game/{best_match.get('game_id')}"
             }
 
+        except urllib.error.HTTPError:
+            # Only 429/5xx get here (see above); search_game retries those
+            raise
         except Exception as e:
             logger.error(f"HLTB search error: {e}")
             return None
@@ -202,16 +241,60 @@ class HLTBService:
             if pattern in name_lower:
                 return None
 
-        try:
-            # Run sync request in thread pool
-            result = await asyncio.to_thread(self._search_sync, game_name)
+        # Concurrent lookups of the same name share one request
+        task = self._inflight.get(game_name)
+        if task is None:
+            task = asyncio.ensure_future(self._search_paced(game_name))
+            self._inflight[game_name] = task
+            task.add_done_callback(lambda _: self._inflight.pop(game_name, None))
 
-            if result:
-                logger.info(f"HLTB: {result['matched_name']} (similarity: {result['similarity']:.2f})")
+        # Shielded so a cancelled caller doesn't cancel the search for the others
+        return await asyncio.shield(task)
 
-            return result
+    async def _search_paced(self, game_name: str) -> Optional[Dict[str, Any]]:
+        """Run one search, waiting for the shared rate limit and retrying if throttled"""
+        try:
+            for attempt in range(HLTB_RETRY_ATTEMPTS + 1):
+                # Only wait for whatever is left of the interval since the last
+                # request started; the first request goes out immediately
+                async with self._rate_limit:
+                    delay = self._next_request_at - time.monotonic()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    self._next_request_at = time.monotonic() + HLTB_REQUEST_INTERVAL
+
+                try:
+                    # Run sync request in thread pool
+                    result = await asyncio.to_thread(self._search_sync, game_name)
+                except urllib.error.HTTPError as e:
+                    self._back_off(e)
+                    continue
+
+                self._backoff = HLTB_BACKOFF_MIN
+                if result:
+                    logger.info(f"HLTB: {result['matched_name']} (similarity: {result['similarity']:.2f})")
+
+                return result
+
+            logger.error(f"HLTB search for {game_name} still throttled after {HLTB_RETRY_ATTEMPTS} retries")
+            return None
 
         except Exception as e:
             logger.error(f"HLTB search failed for {game_name}: {e}")
             return None
 
+    def _back_off(self, error: urllib.error.HTTPError):
+        """Hold back every caller's next request after a 429/5xx response"""
+        try:
+            delay = float(error.headers.get("Retry-After"))
+        except (TypeError, ValueError):
+            delay = self._backoff
+            self._backoff = min(self._backoff * 2, HLTB_BACKOFF_MAX)
+        delay = min(delay, HLTB_BACKOFF_MAX)
+
+        logger.warning(f"HLTB returned HTTP {error.code}, pausing requests for {delay:.1f}s")
+        self._next_request_at = max(self._next_request_at, time.monotonic() + delay)
+
+    def close(self):
+        """Close kept-alive HTTP connections"""
+        self._http.close()
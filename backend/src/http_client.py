@@ -0,0 +1,116 @@
+"""
+Keep-alive HTTPS client
+Reuses one connection per worker thread so repeated requests to the same
+host skip the TCP and TLS handshakes, using standard library only
+"""
+
+import http.client
+import ssl
+import threading
+import urllib.error
+import urllib.parse
+from typing import Dict, Optional, Tuple
+
+# Use Decky's built-in logger
+import decky
+logger = decky.logger
+
+
+# Redirects followed per request, as urlopen does for GET
+REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+MAX_REDIRECTS = 5
+
+
+class KeepAliveClient:
+    """Persistent HTTPS connections to a single host
+
+    Requests run on asyncio.to_thread workers, so each thread gets its own
+    connection (http.client connections aren't thread-safe). GET redirects
+    within the host are followed; any other non-2xx response raises
+    urllib.error.HTTPError.
+    """
+
+    def __init__(self, host: str, context: Optional[ssl.SSLContext] = None, timeout: float = 15):
+        self.host = host
+        self.context = context
+        self.timeout = timeout
+        self._local = threading.local()
+        # Every connection opened, so close() can reach other threads' ones
+        self._connections = []
+        self._lock = threading.Lock()
+
+    def _get_connection(self) -> http.client.HTTPSConnection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = http.client.HTTPSConnection(self.host, timeout=self.timeout, context=self.context)
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def _drop_connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+            with self._lock:
+                if conn in self._connections:
+                    self._connections.remove(conn)
+
+    def request(self, method: str, path: str, body: Optional[bytes] = None,
+                headers: Optional[Dict[str, str]] = None) -> Tuple[int, bytes]:
+        """Send a request and return (status, body)"""
+        headers = headers or {}
+        for _ in range(MAX_REDIRECTS + 1):
+            response, data = self._send(method, path, body, headers)
+            status = response.status
+
+            location = response.getheader("Location")
+            if method != "GET" or status not in REDIRECT_STATUSES or not location:
+                break
+            # Only redirects on the same host can reuse this client's connections
+            target = urllib.parse.urlsplit(urllib.parse.urljoin(f"https://{self.host}{path}", location))
+            if target.scheme != "https" or target.netloc != self.host:
+                break
+            path = urllib.parse.urlunsplit(("", "", target.path or "/", target.query, ""))
+
+        if not 200 <= status < 300:
+            raise urllib.error.HTTPError(
+                f"https://{self.host}{path}", status, response.reason, response.headers, None
+            )
+        return status, data
+
+    def _send(self, method: str, path: str, body: Optional[bytes],
+              headers: Dict[str, str]) -> Tuple[http.client.HTTPResponse, bytes]:
+        """One request/response exchange on this thread's connection"""
+        # A kept-alive connection may have been closed by the server while
+        # idle; that shows up on first use, so retry once on a fresh one
+        for attempt in (0, 1):
+            conn = self._get_connection()
+            try:
+                conn.request(method, path, body=body, headers=headers)
+                response = conn.getresponse()
+                data = response.read()
+                break
+            except (http.client.RemoteDisconnected, http.client.CannotSendRequest,
+                    ConnectionResetError, BrokenPipeError):
+                self._drop_connection()
+                if attempt:
+                    raise
+            except Exception:
+                self._drop_connection()
+                raise
+
+        if response.will_close:
+            self._drop_connection()
+        return response, data
+
+    def close(self):
+        """Close every open connection"""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            try:
+                conn.close()
+            except Exception as e:
+                logger.debug(f"Error closing connection to {self.host}: {e}")
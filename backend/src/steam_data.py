@@ -4,60 +4,210 @@ Parses Steam VDF files to extract game information, playtime, and achievements
 Uses only standard library - no external vdf package
 """
 
+import asyncio
+import functools
+import mmap
 import os
 import re
+import struct
+import sys
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Union
 
 # Use Decky's built-in logger
 import decky
 logger = decky.logger
 
 
+# Tokenizer for text VDF: quoted strings, braces, and bare words. There are no
+# capture groups, so findall returns flat strings rather than a tuple per token.
+_VDF_TOKEN_RE = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[{}]|\S+')
+
+# Keys shorter than this are interned: the same few key names ("name",
+# "playtime", ...) repeat in every entry, so they share one string object
+_INTERN_KEY_MAX_LEN = 32
+
+
+def _parse_object(tokens, result: Dict[str, Any], lowercase_keys: bool = False) -> bool:
+    """
+    Fill `result` with key/value pairs from `tokens` up to the closing brace
+    of the object, recursing into nested objects. The dict being filled is a
+    local at every level, so the per-token loop does no stack indexing.
+    Returns True if the object was closed by '}', False at end of input.
+    """
+    key = None
+    intern = sys.intern
+
+    for token in tokens:
+        if token == '{':
+            # Start new dict
+            if key is not None:
+                child = {}
+                result[key] = child
+                _parse_object(tokens, child, lowercase_keys)
+                key = None
+        elif token == '}':
+            return True
+        else:
+            # Strip the quotes from quoted strings
+            if token[0] == '"' and len(token) > 1 and token[-1] == '"':
+                token = token[1:-1]
+            if key is None:
+                if lowercase_keys:
+                    token = token.lower()
+                key = intern(token) if len(token) < _INTERN_KEY_MAX_LEN else token
+            else:
+                result[key] = token
+                key = None
+
+    return False
+
+
 def parse_vdf(content: str) -> Dict[str, Any]:
     """
     Simple VDF parser using only standard library.
     VDF format is similar to JSON but with different syntax.
     """
     result = {}
-    stack = [result]
-    current_key = None
+    tokens = iter(_VDF_TOKEN_RE.findall(content))
 
-    # Tokenize - handle quoted strings and bare words
-    token_pattern = re.compile(r'"([^"\\]*(?:\\.[^"\\]*)*)"|(\{)|(\})|(\S+)')
+    # A '}' at the top level has nothing to close; skip it and keep going
+    while _parse_object(tokens, result):
+        pass
 
-    for match in token_pattern.finditer(content):
-        quoted, open_brace, close_brace, bare = match.groups()
+    return result
 
-        token = quoted if quoted is not None else bare
 
-        if open_brace:
-            # Start new dict
-            new_dict = {}
+# Key path of the apps section in localconfig.vdf. Each level lists the
+# accepted spellings, lowercased; the first matching key in the file wins.
+LOCALCONFIG_APPS_PATH = (
+    ("userlocalconfigstore", "userroamingconfigstore"),
+    ("software",),
+    ("valve",),
+    ("steam",),
+    ("apps",),
+)
+
+# Known playtime field names of an apps entry, lowercased
+PLAYTIME_FIELDS = ("playtime", "playtimeforever", "playtime_forever", "totalplaytime", "playtime2")
+PLAYTIME_FIELD_SET = frozenset(PLAYTIME_FIELDS)
+
+
+def _parse_vdf_subtree(content: str, path=LOCALCONFIG_APPS_PATH, lowercase_keys: bool = False,
+                       start: int = 0) -> Dict[str, Any]:
+    """
+    Parse only the object found at `path`, skipping everything around it.
+    Dicts are only built inside the target subtree, and scanning stops at
+    its closing brace. Returns {} if the path is not present, as soon as
+    an object on the path closes without it.
+    With lowercase_keys, keys inside the subtree are lowercased so callers
+    need a single lookup per field instead of probing each spelling.
+    `path` is matched from offset `start`, which must be a token boundary.
+    """
+    target_depth = len(path)
+    depth = 0  # current brace depth
+    matched = 0  # leading path levels matched by the open objects
+    current_key = None
+    # Tokenize lazily so nothing after the target subtree is ever scanned
+    tokens = map(re.Match.group, _VDF_TOKEN_RE.finditer(content, start))
+
+    for token in tokens:
+        if token == '{':
             if current_key is not None:
-                stack[-1][current_key] = new_dict
-                stack.append(new_dict)
-                current_key = None
-        elif close_brace:
-            # End current dict
-            if len(stack) > 1:
-                stack.pop()
-        elif token is not None:
-            if current_key is None:
-                current_key = token
-            else:
-                stack[-1][current_key] = token
+                if matched == depth and current_key.lower() in path[depth]:
+                    matched += 1
+                    if matched == target_depth:
+                        break
+                depth += 1
                 current_key = None
+        elif token == '}':
+            # Closing a matched object (the first match wins) or the object
+            # enclosing `start` means the target isn't there
+            if matched == depth:
+                return {}
+            depth -= 1
+        elif current_key is None:
+            if token[0] == '"' and len(token) > 1 and token[-1] == '"':
+                token = token[1:-1]
+            current_key = token
+        else:
+            # Values outside the target are never stored
+            current_key = None
+    else:
+        return {}
 
+    # Materialize the target object until its closing brace
+    result = {}
+    _parse_object(tokens, result, lowercase_keys)
     return result
 
 
-def load_vdf_file(filepath: Path) -> Dict[str, Any]:
-    """Load and parse a VDF file"""
+_APPS_KEY_RE = re.compile(r'"apps"\s*\{', re.IGNORECASE)
+# A quoted string, optionally opening an object ("key" {), or a closing brace
+_SCOPE_TOKEN_RE = re.compile(r'"([^"\\]*(?:\\.[^"\\]*)*)"(\s*\{)?|\}')
+
+
+def _find_localconfig_apps(content: str) -> int:
+    """
+    Offset of the apps key of localconfig.vdf, or -1 if it can't be located.
+    Found by substring search instead of parsing everything before it
+    (certificates, controller bindings, ...) into dicts. A candidate is only
+    accepted if the objects enclosing it are the ones on LOCALCONFIG_APPS_PATH;
+    braces inside quoted strings are skipped.
+    """
+    parent_path = LOCALCONFIG_APPS_PATH[:-1]
+    # Keys of the objects open at the current position, lowercased
+    open_keys = []
+    pos = 0
+
+    for match in _APPS_KEY_RE.finditer(content):
+        for token in _SCOPE_TOKEN_RE.finditer(content, pos, match.start()):
+            if token.group(2):
+                open_keys.append(token.group(1).lower())
+            elif token.group(0) == '}' and open_keys:
+                open_keys.pop()
+            pos = token.end()
+
+        # An unclosed quote before the match means it's inside a string value
+        if '"' in content[pos:match.start()]:
+            continue
+
+        if len(open_keys) == len(parent_path) and all(
+            key in spellings for key, spellings in zip(open_keys, parent_path)
+        ):
+            return match.start()
+
+    return -1
+
+
+def _parse_localconfig_apps(content: str, sub_path: tuple = ()) -> Dict[str, Any]:
+    """Parse the apps section of localconfig.vdf (or the object at sub_path inside it)"""
+    start = _find_localconfig_apps(content)
+    if start != -1:
+        return _parse_vdf_subtree(content, LOCALCONFIG_APPS_PATH[-1:] + sub_path,
+                                  lowercase_keys=True, start=start)
+
+    # Fall back to walking the full path from the top of the file
+    return _parse_vdf_subtree(content, LOCALCONFIG_APPS_PATH + sub_path, lowercase_keys=True)
+
+
+@functools.lru_cache(maxsize=256)
+def _load_vdf_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a VDF file; mtime_ns/size are only part of the cache key"""
+    with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+        content = f.read()
+    return parse_vdf(content)
+
+
+def load_vdf_file(filepath: Union[str, Path]) -> Dict[str, Any]:
+    """Load and parse a VDF file
+
+    Results are cached until the file's mtime or size changes, so the
+    returned dict is shared and must not be modified by callers.
+    """
     try:
-        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
-        return parse_vdf(content)
+        st = os.stat(filepath)
+        return _load_vdf_cached(os.fspath(filepath), st.st_mtime_ns, st.st_size)
     except Exception as e:
         logger.error(f"Failed to parse VDF file {filepath}: {e}")
         return {}
@@ -67,6 +217,12 @@ class SteamDataService:
     def __init__(self):
         self.steam_path = self._find_steam_path()
         self.user_id = None
+        # config path -> (mtime, parsed apps section of localconfig.vdf)
+        self._localconfig_cache: Dict[Path, tuple] = {}
+        # appid -> playtime minutes, built from the apps sections it was built for
+        self._playtime_index: Optional[Dict[str, int]] = None
+        self._playtime_index_sources: List[Dict[str, Any]] = []
+        self._library_folders: Optional[List[Path]] = None
 
     def _find_steam_path(self) -> Optional[Path]:
         """Find Steam installation path"""
@@ -93,23 +249,35 @@ class SteamDataService:
             return None
 
         userdata_path = self.steam_path / "userdata"
-        if not userdata_path.exists():
+
+        # Find the most recently used user directory; DirEntry caches the
+        # file type from the directory listing, so only stat() hits the disk
+        try:
+            with os.scandir(userdata_path) as entries:
+                user_dirs = [
+                    (entry.stat().st_mtime, entry.name) for entry in entries
+                    if entry.name.isdigit() and entry.is_dir()
+                ]
+        except OSError:
             logger.warning("Steam userdata directory not found")
             return None
 
-        # Find the most recently used user directory
-        user_dirs = [d for d in userdata_path.iterdir() if d.is_dir() and d.name.isdigit()]
-
         if not user_dirs:
             logger.warning("No Steam user directories found")
             return None
 
-        # Use the first user directory (or most recently modified)
-        user_dirs.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-        self.user_id = user_dirs[0].name
+        # Use the most recently modified user directory
+        self.user_id = max(user_dirs)[1]
         logger.info(f"Using Steam user ID: {self.user_id}")
         return self.user_id
 
+    def _get_localconfig_paths(self, user_id: str) -> List[Path]:
+        """Candidate localconfig.vdf locations, in lookup order"""
+        return [
+            self.steam_path / "userdata" / user_id / "config" / "localconfig.vdf",
+            self.steam_path / "userdata" / user_id / "localconfig.vdf",
+        ]
+
     async def get_game_playtime(self, appid: str) -> int:
         """Get playtime in minutes from localconfig.vdf or config.vdf"""
         user_id = await self.get_steam_user_id()
@@ -117,86 +285,181 @@ class SteamDataService:
             return 0
 
         # Try multiple config file locations
-        config_paths = [
-            self.steam_path / "userdata" / user_id / "config" / "localconfig.vdf",
-            self.steam_path / "userdata" / user_id / "localconfig.vdf",
-        ]
-
-        for config_path in config_paths:
-            if config_path.exists():
-                playtime = await self._extract_playtime_from_config(config_path, appid)
-                if playtime > 0:
-                    return playtime
+        for config_path in self._get_localconfig_paths(user_id):
+            playtime = await self._extract_playtime_from_config(config_path, appid)
+            if playtime > 0:
+                return playtime
 
         return 0
 
-    async def _extract_playtime_from_config(self, config_path: Path, appid: str) -> int:
-        """Extract playtime from a config file"""
+    async def _load_localconfig_apps(self, config_path: Path) -> Optional[Dict[str, Any]]:
+        """Get the apps section of a config file, parsed once per file version
+
+        localconfig.vdf is multiple MB, so only the apps subtree is parsed,
+        memoized per path and only re-parsed when the file's mtime changes.
+        Returns None if the file doesn't exist.
+        """
         try:
-            data = load_vdf_file(config_path)
+            # Open straight away and fstat the handle: a missing file costs
+            # one failed open instead of an exists() check plus a stat
+            with open(config_path, 'r', encoding='utf-8', errors='ignore') as f:
+                mtime = os.fstat(f.fileno()).st_mtime
 
-            # Navigate through possible structures
-            user_config = data.get("UserLocalConfigStore", data.get("UserRoamingConfigStore", {}))
+                cached = self._localconfig_cache.get(config_path)
+                if cached and cached[0] == mtime:
+                    return cached[1]
 
-            if not user_config:
-                return 0
+                content = f.read()
 
-            software = user_config.get("Software", user_config.get("software", {}))
-            valve = software.get("Valve", software.get("valve", {}))
-            steam = valve.get("Steam", valve.get("steam", {}))
+            # Only the apps section is needed; skip the rest of the file
+            apps = _parse_localconfig_apps(content)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.error(f"Failed to parse config file: {e}")
+            return {}
 
-            # Try both 'apps' and 'Apps'
-            apps = steam.get("apps", steam.get("Apps", {}))
+        self._localconfig_cache[config_path] = (mtime, apps)
+        return apps
 
-            if not apps:
-                return 0
+    async def _get_all_localconfig_apps(self) -> List[Dict[str, Any]]:
+        """Apps sections of every existing localconfig.vdf, in lookup order"""
+        user_id = await self.get_steam_user_id()
+        if not user_id or not self.steam_path:
+            return []
 
-            if appid in apps:
-                app_data = apps[appid]
+        apps_list = []
+        for config_path in self._get_localconfig_paths(user_id):
+            apps = await self._load_localconfig_apps(config_path)
+            if apps is not None:
+                apps_list.append(apps)
+        return apps_list
+
+    def _playtime_from_app_data(self, app_data: Any) -> int:
+        """Read playtime from a single app entry of the apps section"""
+        if isinstance(app_data, dict):
+            # Known playtime field names present in this entry (keys are
+            # lowercased at parse time), checked in priority order
+            hits = PLAYTIME_FIELD_SET & app_data.keys()
+            if hits:
+                for field in PLAYTIME_FIELDS:
+                    if field in hits:
+                        try:
+                            return int(app_data[field])
+                        except (ValueError, TypeError):
+                            pass
 
-                if isinstance(app_data, dict):
-                    # Try all known playtime field names
-                    for field in ["Playtime", "playtime", "PlaytimeForever", "playtime_forever",
-                                  "TotalPlayTime", "totalplaytime", "playtime2", "Playtime2"]:
-                        if field in app_data:
-                            try:
-                                return int(app_data[field])
-                            except (ValueError, TypeError):
-                                pass
+        return 0
 
-            return 0
+    async def _extract_playtime_from_config(self, config_path: Path, appid: str) -> int:
+        """Extract playtime for one app from a config file
+
+        Uses the memoized apps section when it is current. Otherwise parsing
+        stops at the end of this app's entry; the full apps section is only
+        built for batch lookups (see _build_playtime_index).
+        """
+        try:
+            with open(config_path, 'r', encoding='utf-8', errors='ignore') as f:
+                mtime = os.fstat(f.fileno()).st_mtime
 
+                cached = self._localconfig_cache.get(config_path)
+                if cached and cached[0] == mtime:
+                    return self._playtime_from_app_data(cached[1].get(appid))
+
+                content = f.read()
+
+            app_data = _parse_localconfig_apps(content, ((appid,),))
+        except FileNotFoundError:
+            return 0
         except Exception as e:
             logger.error(f"Failed to parse config file: {e}")
             return 0
 
-    async def get_game_name(self, appid: str) -> str:
-        """Get game name from appmanifest files or shortcuts.vdf for non-Steam games"""
-        if not self.steam_path:
-            return f"Unknown Game ({appid})"
+        return self._playtime_from_app_data(app_data)
 
-        # Check common steam library locations for Steam games
-        library_folders = await self.get_library_folders()
+    async def _build_playtime_index(self) -> Dict[str, int]:
+        """Map appid -> playtime minutes over every localconfig.vdf
 
+        Built in one pass over the apps sections and reused until one of them
+        is re-parsed. The first config file with a non-zero playtime wins.
+        """
+        apps_list = await self._get_all_localconfig_apps()
+
+        if (self._playtime_index is not None
+                and len(apps_list) == len(self._playtime_index_sources)
+                and all(a is b for a, b in zip(apps_list, self._playtime_index_sources))):
+            return self._playtime_index
+
+        # Each apps section is indexed by a single comprehension; sections are
+        # merged last to first so earlier config files take priority
+        playtime_index: Dict[str, int] = {}
+        for apps in reversed(apps_list):
+            section_index = {
+                appid: playtime
+                for appid, app_data in apps.items()
+                if (playtime := self._playtime_from_app_data(app_data)) > 0
+            }
+            if playtime_index:
+                playtime_index.update(section_index)
+            else:
+                playtime_index = section_index
+
+        self._playtime_index = playtime_index
+        self._playtime_index_sources = apps_list
+        return playtime_index
+
+    def _get_manifest_name(self, appid: str, library_folders: List[Path]) -> Optional[str]:
+        """Name from the game's appmanifest in any library folder, None if not installed"""
+        # Plain string paths: no PurePath is built per library folder
+        manifest_name = f"appmanifest_{appid}.acf"
         for library_path in library_folders:
-            appmanifest_path = library_path / "steamapps" / f"appmanifest_{appid}.acf"
+            appmanifest_path = os.path.join(library_path, "steamapps", manifest_name)
+
+            # load_vdf_file would stat the file anyway; a missing manifest is
+            # skipped on that stat instead of a separate exists() check
+            try:
+                st = os.stat(appmanifest_path)
+            except OSError:
+                continue
+
+            try:
+                data = _load_vdf_cached(appmanifest_path, st.st_mtime_ns, st.st_size)
+                return data.get("AppState", {}).get("name")
+
+            except Exception as e:
+                logger.error(f"Failed to parse appmanifest for {appid}: {e}")
+
+        return None
 
-            if appmanifest_path.exists():
-                try:
-                    data = load_vdf_file(appmanifest_path)
-                    game_name = data.get("AppState", {}).get("name", f"Unknown Game ({appid})")
-                    return game_name
+    async def get_game_name(self, appid: str) -> Optional[str]:
+        """Get game name from appmanifest files or shortcuts.vdf for non-Steam games
 
-                except Exception as e:
-                    logger.error(f"Failed to parse appmanifest for {appid}: {e}")
+        Returns None when the game isn't found locally, so callers can fall
+        back to other sources without inspecting placeholder names.
+        """
+        names = await self.get_game_names_bulk([appid])
+        return names[appid]
+
+    async def get_game_names_bulk(self, appids: List[str]) -> Dict[str, Optional[str]]:
+        """Get names for many games, parsing shortcuts.vdf at most once
+
+        Returns appid -> name, None for games not found locally.
+        """
+        if not self.steam_path:
+            return {appid: None for appid in appids}
+
+        # Check common steam library locations for Steam games
+        library_folders = await self.get_library_folders()
+        names = {appid: self._get_manifest_name(appid, library_folders) for appid in appids}
 
         # Check non-Steam games in shortcuts.vdf
-        non_steam_games = await self.get_non_steam_games()
-        for game in non_steam_games:
-            if game.get('appid') == appid:
-                return game.get('name', f"Unknown Game ({appid})")
+        missing = [appid for appid, name in names.items() if not name]
+        if missing:
+            shortcut_names = {game.get('appid'): game.get('name') for game in await self.get_non_steam_games()}
+            for appid in missing:
+                names[appid] = shortcut_names.get(appid)
 
-        return f"Unknown Game ({appid})"
+        return names
 
     async def get_steam_api_key(self) -> Optional[str]:
         """Get Steam Web API key from settings or environment"""
@@ -224,45 +487,52 @@ class SteamDataService:
             logger.error(f"Failed to convert user_id {user_id} to SteamID64")
             return None
 
+    def _fetch_json_sync(self, url: str) -> Dict[str, Any]:
+        """Blocking GET + JSON parse, run on a worker thread"""
+        import urllib.request
+        import json as json_lib
+
+        req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
+        with urllib.request.urlopen(req, timeout=10) as response:
+            # json.loads takes the UTF-8 bytes directly
+            return json_lib.loads(response.read())
+
     async def get_achievements_from_web_api(self, appid: str, steamid64: str) -> Dict[str, Any]:
         """Fetch achievements from Steam Web API as fallback
 
         API: GET https://api.steampowered.com/ISteamUserStats/GetPlayerAchievements/v1/
         Params: key, steamid, appid
         """
-        import urllib.request
-        import json as json_lib
-
         api_key = await self.get_steam_api_key()
         if not api_key:
             return {"total": 0, "unlocked": 0, "percentage": 0.0}
 
         try:
             url = f"https://api.steampowered.com/ISteamUserStats/GetPlayerAchievements/v1/?key={api_key}&steamid={steamid64}&appid={appid}"
-            req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
+            # Request and parse block for up to the 10s timeout, so keep them off the event loop
+            data = await asyncio.to_thread(self._fetch_json_sync, url)
 
-            with urllib.request.urlopen(req, timeout=10) as response:
-                data = json_lib.loads(response.read().decode())
+            playerstats = data.get('playerstats', {})
+            if not playerstats.get('success'):
+                return {"total": 0, "unlocked": 0, "percentage": 0.0}
 
-                playerstats = data.get('playerstats', {})
-                if not playerstats.get('success'):
-                    return {"total": 0, "unlocked": 0, "percentage": 0.0}
+            achievements = playerstats.get('achievements', [])
+            if not achievements:
+                return {"total": 0, "unlocked": 0, "percentage": 0.0}
 
-                achievements = playerstats.get('achievements', [])
-                if not achievements:
-                    return {"total": 0, "unlocked": 0, "percentage": 0.0}
+            total = len(achievements)
+            unlocked = sum(1 for ach in achievements if ach.get('achieved') == 1)
+            percentage = (unlocked / total * 100) if total > 0 else 0.0
 
-                total = len(achievements)
-                unlocked = sum(1 for ach in achievements if ach.get('achieved') == 1)
-                percentage = (unlocked / total * 100) if total > 0 else 0.0
+            # Per-game detail: lazy %-formatting so nothing is built unless debug is on
+            logger.debug("Steam Web API: appid %s = %d/%d achievements (%.1f%%)",
+                         appid, unlocked, total, percentage)
 
-                logger.info(f"Steam Web API: appid {appid} = {unlocked}/{total} achievements ({percentage:.1f}%)")
-
-                return {
-                    "total": total,
-                    "unlocked": unlocked,
-                    "percentage": round(percentage, 2)
-                }
+            return {
+                "total": total,
+                "unlocked": unlocked,
+                "percentage": round(percentage, 2)
+            }
 
         except Exception as e:
             return {"total": 0, "unlocked": 0, "percentage": 0.0}
@@ -277,34 +547,37 @@ class SteamDataService:
             return {"total": 0, "unlocked": 0, "percentage": 0.0}
 
         # Try to get achievements from local stats file first (fastest)
-        stats_path = self.steam_path / "userdata" / user_id / appid / "stats"
-
-        if stats_path.exists():
-            # Look for achievement files
-            achievement_files = list(stats_path.glob("*.vdf"))
+        stats_path = os.path.join(self.steam_path, "userdata", user_id, appid, "stats")
 
-            if achievement_files:
-                try:
-                    # Parse the first achievement file found
-                    data = load_vdf_file(achievement_files[0])
-
-                    # Navigate to achievements
-                    achievements = data.get("stats", {}).get("achievements", {})
-
-                    if achievements:
-                        total = len(achievements)
-                        unlocked = sum(1 for ach in achievements.values()
-                                      if isinstance(ach, dict) and ach.get("achieved", "0") == "1")
-                        percentage = (unlocked / total * 100) if total > 0 else 0.0
-
-                        return {
-                            "total": total,
-                            "unlocked": unlocked,
-                            "percentage": round(percentage, 2)
-                        }
-
-                except Exception as e:
-                    logger.error(f"Failed to parse local achievements for {appid}: {e}")
+        # Look for achievement files
+        try:
+            with os.scandir(stats_path) as entries:
+                achievement_files = [entry.path for entry in entries if entry.name.endswith(".vdf")]
+        except OSError:
+            achievement_files = []
+
+        if achievement_files:
+            try:
+                # Parse the first achievement file found
+                data = load_vdf_file(achievement_files[0])
+
+                # Navigate to achievements
+                achievements = data.get("stats", {}).get("achievements", {})
+
+                if achievements:
+                    total = len(achievements)
+                    unlocked = sum(1 for ach in achievements.values()
+                                  if isinstance(ach, dict) and ach.get("achieved", "0") == "1")
+                    percentage = (unlocked / total * 100) if total > 0 else 0.0
+
+                    return {
+                        "total": total,
+                        "unlocked": unlocked,
+                        "percentage": round(percentage, 2)
+                    }
+
+            except Exception as e:
+                logger.error(f"Failed to parse local achievements for {appid}: {e}")
 
         # Fallback: Try Steam Web API
         steamid64 = await self.get_steam_id64(user_id)
@@ -313,8 +586,19 @@ class SteamDataService:
 
         return {"total": 0, "unlocked": 0, "percentage": 0.0}
 
+    def refresh(self):
+        """Forget the cached user ID and library folders (e.g. after an SD card swap)"""
+        self.user_id = None
+        self._library_folders = None
+
     async def get_library_folders(self) -> List[Path]:
-        """Get all Steam library folder paths"""
+        """Get all Steam library folder paths
+
+        Cached for the session; call refresh() to re-read libraryfolders.vdf.
+        """
+        if self._library_folders is not None:
+            return self._library_folders
+
         if not self.steam_path:
             return []
 
@@ -323,6 +607,7 @@ class SteamDataService:
         libraryfolders_path = self.steam_path / "steamapps" / "libraryfolders.vdf"
 
         if not libraryfolders_path.exists():
+            self._library_folders = folders
             return folders
 
         try:
@@ -337,54 +622,83 @@ class SteamDataService:
                     if folder_path.exists():
                         folders.append(folder_path)
 
+            self._library_folders = folders
+
         except Exception as e:
             logger.error(f"Failed to parse libraryfolders.vdf: {e}")
 
         return folders
 
-    async def get_all_games(self) -> List[Dict[str, Any]]:
-        """Get all games in Steam library"""
-        games = []
-        library_folders = await self.get_library_folders()
-
-        for library_path in library_folders:
-            steamapps_path = library_path / "steamapps"
+    def _list_manifests_sync(self, library_path: Path) -> List[tuple]:
+        """(appid, manifest path) for every appmanifest in one library folder"""
+        steamapps_path = os.path.join(library_path, "steamapps")
 
-            if not steamapps_path.exists():
-                continue
+        # Find all appmanifest files (scandir avoids a Path per entry)
+        try:
+            with os.scandir(steamapps_path) as entries:
+                return [
+                    # Extract appid from filename: appmanifest_<appid>.acf
+                    (entry.name[len("appmanifest_"):-len(".acf")], entry.path)
+                    for entry in entries
+                    if entry.name.startswith("appmanifest_") and entry.name.endswith(".acf")
+                ]
+        except OSError:
+            return []
 
-            # Find all appmanifest files
-            appmanifest_files = steamapps_path.glob("appmanifest_*.acf")
+    def _parse_manifest(self, appid: str, manifest_path: str) -> Optional[Dict[str, Any]]:
+        """Read the game name from one appmanifest (runs on a worker thread)"""
+        try:
+            data = load_vdf_file(manifest_path)
 
-            for manifest_path in appmanifest_files:
-                try:
-                    # Extract appid from filename
-                    appid = manifest_path.stem.replace("appmanifest_", "")
+            app_state = data.get("AppState", {})
+            return {
+                "appid": appid,
+                "name": app_state.get("name", f"Unknown ({appid})")
+            }
 
-                    data = load_vdf_file(manifest_path)
+        except Exception as e:
+            logger.error(f"Failed to parse {manifest_path}: {e}")
+            return None
 
-                    app_state = data.get("AppState", {})
-                    game_name = app_state.get("name", f"Unknown ({appid})")
+    def _parse_manifests_sync(self, manifests: List[tuple]) -> List[Optional[Dict[str, Any]]]:
+        """_parse_manifest over a batch of (appid, manifest path) pairs"""
+        return [self._parse_manifest(appid, manifest_path) for appid, manifest_path in manifests]
 
-                    # Get playtime
-                    playtime = await self.get_game_playtime(appid)
+    async def get_all_games(self) -> List[Dict[str, Any]]:
+        """Get all games in Steam library"""
+        library_folders = await self.get_library_folders()
 
-                    games.append({
-                        "appid": appid,
-                        "name": game_name,
-                        "playtime_minutes": playtime
-                    })
+        # Index playtime once up front instead of walking localconfig per game
+        playtime_index = await self._build_playtime_index()
+
+        per_library = await asyncio.gather(*(
+            asyncio.to_thread(self._list_manifests_sync, library_path)
+            for library_path in library_folders
+        ))
+
+        # Parse manifests concurrently on worker threads so disk reads overlap
+        # with parsing (the SD card is much slower than internal storage).
+        # One batch per CPU: a task per manifest costs more in thread handoffs
+        # than a cached parse does
+        manifests = [manifest for library_manifests in per_library for manifest in library_manifests]
+        batch_size = -(-len(manifests) // (os.cpu_count() or 4))
+        parsed = await asyncio.gather(*(
+            asyncio.to_thread(self._parse_manifests_sync, manifests[i:i + batch_size])
+            for i in range(0, len(manifests), batch_size or 1)
+        ))
 
-                except Exception as e:
-                    logger.error(f"Failed to parse {manifest_path}: {e}")
-                    continue
+        games = []
+        for game in (game for batch in parsed for game in batch):
+            if game is not None:
+                game["playtime_minutes"] = playtime_index.get(game["appid"], 0)
+                games.append(game)
 
         logger.info(f"Found {len(games)} games in library")
         return games
 
     async def get_game_stats_full(self, appid: str) -> Dict[str, Any]:
         """Get complete game statistics (name, playtime, achievements)"""
-        game_name = await self.get_game_name(appid)
+        game_name = await self.get_game_name(appid) or f"Unknown Game ({appid})"
         playtime = await self.get_game_playtime(appid)
         achievements = await self.get_game_achievements(appid)
 
@@ -405,28 +719,31 @@ class SteamDataService:
 
         shortcuts_path = self.steam_path / "userdata" / user_id / "config" / "shortcuts.vdf"
 
-        if not shortcuts_path.exists():
-            return []
-
         games = []
         try:
-            # shortcuts.vdf is a binary VDF file, need special parsing
+            # shortcuts.vdf is a binary VDF file, need special parsing.
+            # Map it instead of reading it so only the touched pages are loaded
             with open(shortcuts_path, 'rb') as f:
-                content = f.read()
-
-            # Parse binary VDF format for shortcuts
-            # This is a simplified parser that extracts appid and appname
-            games = self._parse_shortcuts_binary(content)
+                if os.fstat(f.fileno()).st_size == 0:
+                    return []
+                content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+            try:
+                # Parse binary VDF format for shortcuts
+                # This is a simplified parser that extracts appid and appname
+                games = self._parse_shortcuts_binary(content)
+            finally:
+                content.close()
             logger.info(f"Found {len(games)} non-Steam games")
 
+        except FileNotFoundError:
+            return []
         except Exception as e:
-            logger.error(f"Failed to parse shortcuts.vdf: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.error(f"Failed to parse shortcuts.vdf: {e}", exc_info=True)
 
         return games
 
-    def _parse_shortcuts_binary(self, content: bytes) -> List[Dict[str, Any]]:
+    def _parse_shortcuts_binary(self, content: Union[bytes, mmap.mmap]) -> List[Dict[str, Any]]:
         """Parse binary shortcuts.vdf format
 
         Binary VDF format uses:
@@ -442,7 +759,12 @@ class SteamDataService:
             appname_marker = b'\x01appname\x00'
             appid_marker = b'\x02appid\x00'
 
+            # Both markers are walked forward in a single pass: the appid cursor
+            # only ever advances up to the current appname, so no byte range is
+            # searched twice and no slices are copied
             pos = 0
+            appid_cursor = 0
+            last_appid_pos = -1
             while True:
                 # Find next appname
                 name_pos = content.find(appname_marker, pos)
@@ -457,19 +779,20 @@ class SteamDataService:
 
                 app_name = content[name_start:name_end].decode('utf-8', errors='ignore')
 
-                # Look for appid before appname (it comes first in each entry)
-                # Search backwards from appname position
-                search_start = max(0, name_pos - 100)
-                search_chunk = content[search_start:name_pos]
+                # Look for appid before appname (it comes first in each entry):
+                # the last appid marker within 100 bytes before the appname
+                while True:
+                    appid_pos = content.find(appid_marker, appid_cursor, name_pos)
+                    if appid_pos == -1:
+                        break
+                    last_appid_pos = appid_pos
+                    appid_cursor = appid_pos + 1
 
                 appid = None
-                appid_offset = search_chunk.rfind(appid_marker)  # Find last occurrence before appname
-                if appid_offset != -1:
-                    appid_start = appid_offset + len(appid_marker)
-                    if appid_start + 4 <= len(search_chunk):
-                        appid_bytes = search_chunk[appid_start:appid_start + 4]
-                        # Interpret as unsigned 32-bit integer
-                        appid = int.from_bytes(appid_bytes, 'little', signed=False)
+                appid_start = last_appid_pos + len(appid_marker)
+                if last_appid_pos != -1 and last_appid_pos >= name_pos - 100 and appid_start + 4 <= name_pos:
+                    # Interpret as unsigned little-endian 32-bit integer
+                    appid = struct.unpack_from('<I', content, appid_start)[0]
 
                 if app_name and appid:
                     games.append({
@@ -482,8 +805,6 @@ class SteamDataService:
                 pos = name_end + 1
 
         except Exception as e:
-            logger.error(f"Error parsing shortcuts binary: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.error(f"Error parsing shortcuts binary: {e}", exc_info=True)
 
         return games
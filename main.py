@@ -6,6 +6,8 @@ Decky Loader plugin for automatic game tagging
 # Standard library imports first
 import os
 import sys
+import logging
+import time
 import asyncio
 from pathlib import Path
 from typing import Optional, Dict, Any, List
@@ -14,18 +16,90 @@ from typing import Optional, Dict, Any, List
 import decky
 import json
 
+SECONDS_PER_DAY = 24 * 60 * 60
+# Games not played for longer than this are auto-tagged as dropped
+_ONE_YEAR_SECONDS = 365 * SECONDS_PER_DAY
+
+# Tags accepted by set_manual_tag
+_VALID_TAGS = frozenset({'completed', 'in_progress', 'mastered', 'dropped'})
+
+# Display order of tagged games in get_all_tags_with_names
+_TAG_SORT_ORDER = {'completed': 0, 'mastered': 1, 'in_progress': 2, 'dropped': 3}
+
+# log_frontend level names -> logging levels (anything else logs as info)
+_FRONTEND_LOG_LEVELS = {'error': logging.ERROR, 'warn': logging.WARNING, 'info': logging.INFO}
+
+# Names stored for games whose real name wasn't known at sync time
+_PLACEHOLDER_NAME_PREFIXES = ('Unknown Game', 'Game ')
+
+# Locally resolved game names are reused for this long
+NAME_CACHE_TTL = 3600
+# Steam store names practically never change, keep them for a day
+STORE_NAME_CACHE_TTL = SECONDS_PER_DAY
+NAME_CACHE_MAX_SIZE = 1024
+
+# Appids above this belong to non-Steam shortcuts
+NON_STEAM_APPID_MIN = 2000000000
+
+# Number of games synced concurrently by sync_library_with_playtime
+SYNC_CONCURRENCY = 5
+# Stats/HLTB rows from a library sync are written in batches of this size
+SYNC_WRITE_BATCH = 200
+
+
+def _is_non_steam_appid(appid: Any) -> bool:
+    """Non-Steam shortcuts get CRC32-based appids above NON_STEAM_APPID_MIN"""
+    appid = str(appid)
+    # Steam appids are at most 7 digits, so they never reach the int() call
+    return len(appid) >= 10 and appid.isascii() and appid.isdigit() and int(appid) > NON_STEAM_APPID_MIN
+
+
+def _ttl_cache_get(cache: Dict[str, tuple], key: str, ttl: float):
+    """Return (True, value) for an entry younger than ttl, else (False, None)"""
+    entry = cache.get(key)
+    if entry and time.monotonic() - entry[0] < ttl:
+        return True, entry[1]
+    return False, None
+
+
+def _ttl_cache_put(cache: Dict[str, tuple], key: str, value: Any) -> None:
+    """Store value, evicting the oldest entry once NAME_CACHE_MAX_SIZE is reached"""
+    cache.pop(key, None)
+    if len(cache) >= NAME_CACHE_MAX_SIZE:
+        # Dicts keep insertion order, so the first key is the oldest
+        cache.pop(next(iter(cache)))
+    cache[key] = (time.monotonic(), value)
+
+
+def _env_seconds(name: str, default: int) -> int:
+    """Read a duration in seconds from the environment, falling back to default"""
+    try:
+        return max(0, int(os.environ.get(name, default)))
+    except ValueError:
+        return default
+
+
+# Dropped games check schedule (overridable for tuning on constrained devices)
+DROPPED_FIRST_DELAY = _env_seconds("DROPPED_FIRST_DELAY_SEC", 3600)
+DROPPED_CHECK_INTERVAL = _env_seconds("DROPPED_CHECK_INTERVAL_SEC", SECONDS_PER_DAY)
+# Retry delay after a failed check doubles from min up to max
+DROPPED_RETRY_MIN = 60
+DROPPED_RETRY_MAX = 3600
+
 # Setup paths - everything is in backend/src/
 PLUGIN_DIR = Path(decky.DECKY_PLUGIN_DIR)
 BACKEND_SRC = PLUGIN_DIR / "backend" / "src"
+BACKEND_SRC_EXISTS = BACKEND_SRC.exists()
+# Fallback data directory when Decky doesn't provide DECKY_PLUGIN_RUNTIME_DIR
+DEFAULT_RUNTIME_DIR = os.path.join(os.path.expanduser("~"), ".local", "share", "decky", "deck-progress-tracker")
 
 # Read version from plugin.json
 def get_plugin_version():
     try:
-        plugin_json_path = PLUGIN_DIR / "plugin.json"
-        if plugin_json_path.exists():
-            with open(plugin_json_path) as f:
-                data = json.load(f)
-                return data.get("version", "unknown")
+        # json.loads takes the UTF-8 bytes directly; a missing file lands in
+        # the except below instead of costing a separate exists() stat
+        data = json.loads((PLUGIN_DIR / "plugin.json").read_bytes())
+        return data.get("version", "unknown")
     except Exception:
         pass
     return "unknown"
@@ -35,19 +109,19 @@ PLUGIN_VERSION = get_plugin_version()
 logger = decky.logger
 logger.info(f"=== Deck Progress Tracker v{PLUGIN_VERSION} starting ===")
 logger.info(f"Plugin dir: {PLUGIN_DIR}")
-logger.info(f"Backend src: {BACKEND_SRC} exists={BACKEND_SRC.exists()}")
+logger.info(f"Backend src: {BACKEND_SRC} exists={BACKEND_SRC_EXISTS}")
 
 # Add backend/src to path - all modules and dependencies are there
-if BACKEND_SRC.exists() and str(BACKEND_SRC) not in sys.path:
+if BACKEND_SRC_EXISTS and str(BACKEND_SRC) not in sys.path:
     sys.path.insert(0, str(BACKEND_SRC))
     logger.info(f"Added to sys.path: {BACKEND_SRC}")
 
-# List contents of backend/src specifically
-if BACKEND_SRC.exists():
+# List contents of backend/src specifically (debug only, it stats every entry)
+if BACKEND_SRC_EXISTS and logger.isEnabledFor(logging.DEBUG):
     src_contents = list(BACKEND_SRC.iterdir())
-    logger.info(f"backend/src/ contains {len(src_contents)} items:")
+    logger.debug(f"backend/src/ contains {len(src_contents)} items:")
     for item in src_contents[:30]:
-        logger.info(f"  - {item.name}")
+        logger.debug(f"  - {item.name}")
 
 logger.info(f"sys.path: {sys.path[:5]}...")  # First 5 entries
 
@@ -56,11 +130,10 @@ try:
     from database import Database
     from steam_data import SteamDataService
     from hltb_service import HLTBService
+    from http_client import KeepAliveClient
     logger.info("Backend modules imported successfully")
 except ImportError as e:
-    logger.error(f"Import failed: {e}")
-    import traceback
-    logger.error(traceback.format_exc())
+    logger.exception(f"Import failed: {e}")
     # Create dummy classes so plugin can at least load
     class Database:
         def __init__(self, *args): pass
@@ -68,23 +141,37 @@ except ImportError as e:
         async def close(self): pass
     class SteamDataService:
         def __init__(self): pass
+        def refresh(self): pass
     class HLTBService:
         def __init__(self): pass
+        def close(self): pass
+    class KeepAliveClient:
+        def __init__(self, *args, **kwargs): pass
+        def close(self): pass
 
 
 class Plugin:
     """Main plugin class for Decky Loader"""
 
+    # Defaults until _main runs, so _unload is safe after a partial init.
+    # Class attributes rather than __init__, as older Decky Loader versions
+    # call the methods with the class itself as self.
+    db = None
+    steam_service = None
+    hltb_service = None
+    store_http = None
+    dropped_task = None
+    sync_in_progress = False
+    sync_current = 0
+    sync_total = 0
+
     async def _main(self):
         """Initialize plugin on load"""
         logger.info("Deck Progress Tracker plugin starting...")
 
         # Get plugin data directory
-        self.plugin_dir = os.environ.get(
-            "DECKY_PLUGIN_RUNTIME_DIR",
-            str(Path.home() / ".local" / "share" / "decky" / "deck-progress-tracker")
-        )
-        Path(self.plugin_dir).mkdir(parents=True, exist_ok=True)
+        self.plugin_dir = os.environ.get("DECKY_PLUGIN_RUNTIME_DIR", DEFAULT_RUNTIME_DIR)
+        os.makedirs(self.plugin_dir, exist_ok=True)
 
         # Initialize database
         db_path = os.path.join(self.plugin_dir, "game_tracker.db")
@@ -94,6 +181,11 @@ class Plugin:
         # Initialize services
         self.steam_service = SteamDataService()
         self.hltb_service = HLTBService()
+        # Store name lookups reuse one connection per worker thread
+        self.store_http = KeepAliveClient("store.steampowered.com", timeout=5)
+        # appid -> (time.monotonic() when resolved, name), see _ttl_cache_put
+        self._name_cache = {}
+        self._store_name_cache = {}
 
         # Initialize sync progress tracking
         self.sync_in_progress = False
@@ -114,43 +206,52 @@ class Plugin:
         """Cleanup on plugin unload"""
         logger.info("Unloading plugin...")
 
-        # Cancel background task
-        if hasattr(self, 'dropped_task'):
-            self.dropped_task.cancel()
-            try:
-                await self.dropped_task
-            except asyncio.CancelledError:
-                pass
-            logger.info("Stopped background task for dropped games checking")
-
-        if hasattr(self, 'db'):
-            await self.db.close()
+        # Cancel background task before closing the DB it writes to; the
+        # DB is closed even if the task ends with an unexpected error
+        try:
+            if self.dropped_task is not None:
+                self.dropped_task.cancel()
+                try:
+                    await self.dropped_task
+                except asyncio.CancelledError:
+                    pass
+                except Exception as e:
+                    logger.error(f"Dropped games checker failed during unload: {e}")
+                logger.info("Stopped background task for dropped games checking")
+        finally:
+            for client in (self.hltb_service, self.store_http):
+                if client is not None:
+                    client.close()
+            if self.db is not None:
+                await self.db.close()
 
     async def _dropped_games_checker(self):
         """Background task that runs daily to check and tag dropped games"""
         logger.info("Dropped games checker task started")
 
-        # Wait 1 hour after plugin load before first check (let things settle)
-        await asyncio.sleep(3600)
+        # Wait after plugin load before first check (let things settle)
+        await asyncio.sleep(DROPPED_FIRST_DELAY)
 
+        retry_delay = DROPPED_RETRY_MIN
         while True:
             try:
                 logger.info("Running daily dropped games check...")
                 dropped_count = await self._check_and_tag_dropped_games()
                 logger.info(f"Dropped games check complete: {dropped_count} games tagged as dropped")
+                retry_delay = DROPPED_RETRY_MIN
 
-                # Sleep for 24 hours until next check
-                await asyncio.sleep(24 * 60 * 60)
+                # Sleep until next check (24 hours by default)
+                await asyncio.sleep(DROPPED_CHECK_INTERVAL)
 
             except asyncio.CancelledError:
                 logger.info("Dropped games checker task cancelled")
                 break
             except Exception as e:
-                logger.error(f"Error in dropped games checker: {e}")
-                import traceback
-                logger.error(traceback.format_exc())
-                # Wait 1 hour before retrying on error
-                await asyncio.sleep(3600)
+                logger.exception(f"Error in dropped games checker: {e}")
+                # Retry with capped exponential backoff, so a transient error
+                # is retried quickly and a persistent one doesn't spin
+                await asyncio.sleep(retry_delay)
+                retry_delay = min(retry_delay * 2, DROPPED_RETRY_MAX)
 
     async def _check_and_tag_dropped_games(self, days_threshold: int = 365) -> int:
         """Check database for games that should be tagged as dropped
@@ -174,36 +275,30 @@ class Plugin:
             if not eligible_games:
                 return 0
 
-            dropped_count = 0
-            for game in eligible_games:
-                appid = game['appid']
-                game_name = game['game_name']
-                rt_last_time_played = game['rt_last_time_played']
+            # Tag all eligible games as dropped in one transaction
+            appids = [game['appid'] for game in eligible_games]
+            dropped_count = await self.db.bulk_set_tag(appids, 'dropped', is_manual=False)
 
+            if not dropped_count:
+                logger.error(f"Failed to tag {len(appids)} games as dropped")
+                return 0
+
+            current_time = int(time.time())
+            for game in eligible_games:
                 # Calculate days since played for logging
-                import time
-                current_time = int(time.time())
-                days_since_played = (current_time - rt_last_time_played) / (24 * 60 * 60)
-
-                # Tag as dropped
-                success = await self.db.set_tag(appid, 'dropped', is_manual=False)
-                if success:
-                    dropped_count += 1
-                    logger.info(f"Tagged as dropped: {game_name} (appid={appid}, not played for {days_since_played:.0f} days)")
-                else:
-                    logger.error(f"Failed to tag as dropped: {game_name} (appid={appid})")
+                days_since_played = (current_time - game['rt_last_time_played']) / SECONDS_PER_DAY
+                logger.info(f"Tagged as dropped: {game['game_name']} (appid={game['appid']}, not played for {days_since_played:.0f} days)")
 
             return dropped_count
 
         except Exception as e:
-            logger.error(f"Error checking dropped games: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"Error checking dropped games: {e}")
             return 0
 
     # ==================== Tag Calculation Logic ====================
 
-    async def calculate_auto_tag(self, appid: str) -> Optional[str]:
+    async def calculate_auto_tag(self, appid: str, stats: Optional[Dict[str, Any]] = None,
+                                 hltb: Optional[Dict[str, Any]] = None) -> Optional[str]:
         """Calculate automatic tag based on game stats
 
         Tag priority:
@@ -212,20 +307,17 @@ class Plugin:
         3. Dropped: Not played for over 1 year (only if not mastered/completed)
         4. In Progress: playtime >= threshold (default 30 min)
 
+        stats and hltb can be passed in when the caller has them but hasn't
+        saved them yet; otherwise they are read from the database.
+
         Note: Hidden games (non-Steam apps without HLTB) are filtered at sync level.
         """
         # Get game statistics
-        stats = await self.db.get_game_stats(appid)
+        if stats is None:
+            stats = await self.db.get_game_stats(appid)
         if not stats:
             return None
 
-        # Get HLTB data
-        hltb = await self.db.get_hltb_cache(appid)
-
-        # Get settings
-        settings = await self.db.get_all_settings()
-        in_progress_threshold = settings.get('in_progress_threshold', 30)  # Default 30 min
-
         # Priority 1: Mastered (>=85% achievements)
         # Calculate percentage from total/unlocked since it's not stored in DB
         total_achievements = stats.get('total_achievements', 0)
@@ -239,26 +331,30 @@ class Plugin:
             return "mastered"
 
         # Priority 2: Completed (beat main story - playtime >= main_story)
-        if hltb and hltb.get('main_story'):
-            main_story_hours = hltb['main_story']
-            main_story_minutes = main_story_hours * 60
-
-            if stats['playtime_minutes'] >= main_story_minutes:
-                return "completed"
+        # An unplayed game can't have beaten a positive main_story time,
+        # so only look up HLTB data once there is playtime
+        playtime_minutes = stats['playtime_minutes']
+        if playtime_minutes > 0:
+            if hltb is None:
+                hltb = await self.db.get_hltb_cache(appid)
+            if hltb and hltb.get('main_story'):
+                main_story_hours = hltb['main_story']
+                main_story_minutes = main_story_hours * 60
+
+                if playtime_minutes >= main_story_minutes:
+                    return "completed"
 
         # Priority 3: Dropped (not played for over 1 year)
         # Only check if game was played before (has rt_last_time_played)
         # Don't override mastered/completed above
         rt_last_time_played = stats.get('rt_last_time_played')
         if rt_last_time_played and rt_last_time_played > 0:
-            import time
-            current_time = int(time.time())
-            one_year_seconds = 365 * 24 * 60 * 60
-            if current_time - rt_last_time_played > one_year_seconds:
+            if int(time.time()) - rt_last_time_played > _ONE_YEAR_SECONDS:
                 return "dropped"
 
         # Priority 4: In Progress (played >= threshold)
-        if stats['playtime_minutes'] >= in_progress_threshold:
+        in_progress_threshold = await self.db.get_setting('in_progress_threshold', 30)  # Default 30 min
+        if playtime_minutes >= in_progress_threshold:
             return "in_progress"
 
         return None  # No tag (backlog)
@@ -266,50 +362,69 @@ class Plugin:
     async def sync_game_tags(self, appid: str, force: bool = False) -> Dict[str, Any]:
         """Sync tags for a single game"""
         try:
-            # Get current tag
-            current_tag = await self.db.get_tag(appid)
+            # Get current tag and cached HLTB data together
+            current_tag, cached_hltb = await asyncio.gather(
+                self.db.get_tag(appid),
+                self.db.get_hltb_cache(appid)
+            )
 
             # Skip if manual override and not forcing
             if current_tag and current_tag.get('is_manual') and not force:
                 return current_tag
 
-            # Fetch fresh game stats
+            # Fetch fresh game stats (saved together with the tag below)
             stats = await self.steam_service.get_game_stats_full(appid)
-            await self.db.update_game_stats(appid, stats)
 
             # Log playtime and achievement info
-            logger.info(f"  Stats: playtime={stats.get('playtime_minutes', 0)}min, " +
-                        f"achievements={stats.get('unlocked_achievements', 0)}/{stats.get('total_achievements', 0)}")
+            logger.debug("  Stats: playtime=%smin, achievements=%s/%s",
+                         stats.get('playtime_minutes', 0),
+                         stats.get('unlocked_achievements', 0),
+                         stats.get('total_achievements', 0))
 
             # Fetch HLTB data if not cached
-            cached_hltb = await self.db.get_hltb_cache(appid)
+            new_hltb = None
             if not cached_hltb:
-                hltb_data = await self.hltb_service.search_game(stats['game_name'])
-                if hltb_data:
-                    await self.db.cache_hltb_data(appid, hltb_data)
-                    cached_hltb = hltb_data
+                new_hltb = await self.hltb_service.search_game(stats['game_name'])
+                if new_hltb:
+                    cached_hltb = new_hltb
 
             # Log HLTB info
             if cached_hltb:
-                logger.info(f"  HLTB: main={cached_hltb.get('main_story')}h, extra={cached_hltb.get('main_extra')}h")
+                logger.debug("  HLTB: main=%sh, extra=%sh", cached_hltb.get('main_story'), cached_hltb.get('main_extra'))
             else:
-                logger.info(f"  HLTB: no data")
+                logger.debug("  HLTB: no data")
 
-            # Calculate new tag
-            new_tag = await Plugin.calculate_auto_tag(self, appid)
-            logger.info(f"  Calculated tag: {new_tag or 'none'}")
+            # Calculate new tag from the fresh stats before anything is saved
+            # ({} tells it there is no HLTB data to look up)
+            new_tag = await self.calculate_auto_tag(appid, stats, cached_hltb or {})
+            logger.debug("  Calculated tag: %s", new_tag or 'none')
 
             # Update if changed, doesn't exist, or forcing reset from manual
+            tag_to_set = None
             if new_tag:
                 current_tag_value = current_tag.get('tag') if current_tag else None
                 is_currently_manual = current_tag.get('is_manual', False) if current_tag else False
 
                 # Update if: tag changed, no existing tag, or resetting from manual (force=True)
                 if new_tag != current_tag_value or (force and is_currently_manual):
-                    await self.db.set_tag(appid, new_tag, is_manual=False)
-                    logger.info(f"  -> Tag set: {new_tag} (reset_manual={force and is_currently_manual})")
+                    tag_to_set = new_tag
+                    logger.debug("  -> Tag set: %s (reset_manual=%s)", new_tag, force and is_currently_manual)
 
-            return await self.db.get_tag(appid) or {}
+            # Stats, new HLTB data and tag in one transaction (one commit)
+            saved = await self.db.apply_sync_result(appid, stats, new_hltb, tag_to_set)
+
+            if tag_to_set and saved:
+                # The row just written, built here instead of read back
+                # (last_updated in SQLite's CURRENT_TIMESTAMP format)
+                return {
+                    "appid": appid,
+                    "tag": tag_to_set,
+                    "is_manual": False,
+                    "last_updated": time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime())
+                }
+
+            # Tag unchanged: the row read above is still current
+            return current_tag or {}
 
         except Exception as e:
             logger.error(f"Failed to sync tags for {appid}: {e}")
@@ -341,17 +456,15 @@ class Plugin:
     async def get_game_tag(self, appid) -> Dict[str, Any]:
         """Get tag for a specific game"""
         appid = self._extract_appid(appid)
-        logger.info(f"=== get_game_tag called: appid={appid} ===")
+        logger.debug("=== get_game_tag called: appid=%s ===", appid)
         try:
             tag = await self.db.get_tag(appid)
-            logger.info(f"[get_game_tag] appid={appid}, tag={tag}")
+            logger.debug("[get_game_tag] appid=%s, tag=%s", appid, tag)
             if tag:
                 return {"success": True, "tag": tag}
             return {"success": True, "tag": None}
         except Exception as e:
-            logger.error(f"Error getting tag for {appid}: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"Error getting tag for {appid}: {e}")
             return {"success": False, "error": str(e)}
 
     async def set_manual_tag(self, appid_or_params, tag: str = None) -> Dict[str, bool]:
@@ -370,8 +483,8 @@ class Plugin:
 
         try:
             # Validate tag
-            valid_tags = ['completed', 'in_progress', 'mastered', 'dropped']
-            if tag not in valid_tags:
+            if tag not in _VALID_TAGS:
+                valid_tags = sorted(_VALID_TAGS)
                 logger.error(f"Invalid tag: {tag}. Must be one of: {valid_tags}")
                 return {"success": False, "error": f"Invalid tag. Must be one of: {valid_tags}"}
 
@@ -379,9 +492,7 @@ class Plugin:
             logger.info(f"[set_manual_tag] appid={appid}, tag={tag}, success={success}")
             return {"success": success}
         except Exception as e:
-            logger.error(f"Error setting manual tag for {appid}: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"Error setting manual tag for {appid}: {e}")
             return {"success": False, "error": str(e)}
 
     async def remove_tag(self, appid) -> Dict[str, bool]:
@@ -399,7 +510,7 @@ class Plugin:
         appid = self._extract_appid(appid)
         try:
             # Force recalculation
-            result = await Plugin.sync_game_tags(self, appid, force=True)
+            result = await self.sync_game_tags(appid, force=True)
             return {"success": True, "tag": result}
         except Exception as e:
             logger.error(f"Error resetting tag for {appid}: {e}")
@@ -411,36 +522,36 @@ class Plugin:
     async def get_game_details(self, appid) -> Dict[str, Any]:
         """Get all details for a game"""
         appid = self._extract_appid(appid)
-        logger.info(f"=== get_game_details called: appid={appid} ===")
+        logger.debug("=== get_game_details called: appid=%s ===", appid)
         try:
             # Get stats
             stats = await self.db.get_game_stats(appid)
-            logger.info(f"[get_game_details] stats from db: {stats}")
+            logger.debug("[get_game_details] stats from db: %s", stats)
 
             # If no stats, fetch from Steam
             if not stats:
-                logger.info(f"[get_game_details] no stats in db, fetching from Steam...")
+                logger.debug("[get_game_details] no stats in db, fetching from Steam...")
                 stats = await self.steam_service.get_game_stats_full(appid)
-                logger.info(f"[get_game_details] stats from Steam: {stats}")
+                logger.debug("[get_game_details] stats from Steam: %s", stats)
                 if stats:
                     await self.db.update_game_stats(appid, stats)
 
             # Get tag
             tag = await self.db.get_tag(appid)
-            logger.info(f"[get_game_details] tag: {tag}")
+            logger.debug("[get_game_details] tag: %s", tag)
 
             # Get HLTB data
             hltb_data = await self.db.get_hltb_cache(appid)
-            logger.info(f"[get_game_details] hltb_data: {hltb_data}")
+            logger.debug("[get_game_details] hltb_data: %s", hltb_data)
 
             # Fix game name if it's "Unknown Game" (e.g., non-Steam games)
             if stats:
                 game_name = stats.get('game_name')
-                if not game_name or game_name.startswith('Unknown Game') or game_name.startswith('Game '):
-                    real_name = await self.steam_service.get_game_name(appid)
-                    if real_name and not real_name.startswith('Unknown Game') and not real_name.startswith('Game '):
+                if not game_name or game_name.startswith(_PLACEHOLDER_NAME_PREFIXES):
+                    real_name = await self._get_real_name_cached(appid)
+                    if real_name:
                         stats['game_name'] = real_name
-                        logger.info(f"[get_game_details] fixed game_name to: {real_name}")
+                        logger.debug("[get_game_details] fixed game_name to: %s", real_name)
 
             result = {
                 "success": True,
@@ -449,15 +560,40 @@ class Plugin:
                 "tag": tag,
                 "hltb_data": hltb_data
             }
-            logger.info(f"[get_game_details] returning: success=True")
+            logger.debug("[get_game_details] returning: success=True")
             return result
 
         except Exception as e:
-            logger.error(f"Error getting game details for {appid}: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"Error getting game details for {appid}: {e}")
             return {"success": False, "error": str(e)}
 
+    async def _get_real_name_cached(self, appid: str) -> Optional[str]:
+        """Resolve a game name from local Steam data, reusing recent lookups"""
+        hit, name = _ttl_cache_get(self._name_cache, appid, NAME_CACHE_TTL)
+        if hit:
+            return name
+
+        name = await self.steam_service.get_game_name(appid)
+        _ttl_cache_put(self._name_cache, appid, name)
+        return name
+
+    async def _get_real_names_cached(self, appids: List[str]) -> Dict[str, Optional[str]]:
+        """Bulk _get_real_name_cached: uncached games are resolved in one lookup"""
+        names = {}
+        missing = []
+        for appid in appids:
+            hit, name = _ttl_cache_get(self._name_cache, appid, NAME_CACHE_TTL)
+            if hit:
+                names[appid] = name
+            else:
+                missing.append(appid)
+
+        if missing:
+            for appid, name in (await self.steam_service.get_game_names_bulk(missing)).items():
+                _ttl_cache_put(self._name_cache, appid, name)
+                names[appid] = name
+        return names
+
     async def get_settings(self) -> Dict[str, Any]:
         """Get all plugin settings"""
         try:
@@ -483,36 +619,17 @@ class Plugin:
         """Get counts per tag type"""
         logger.info("=== get_tag_statistics called ===")
         try:
-            all_tags = await self.db.get_all_tags()
-            logger.info(f"[get_tag_statistics] all_tags count: {len(all_tags) if all_tags else 0}")
-            if all_tags:
-                logger.info(f"[get_tag_statistics] all_tags sample (first 3): {all_tags[:3]}")
-
-            # Exclude hidden games from statistics (non-Steam apps without HLTB data)
-            all_games = await self.db.get_all_game_stats(include_hidden=False)
-            total_library = len(all_games) if all_games else 0
+            # Both counts are computed in SQL; hidden games (non-Steam apps
+            # without HLTB data) are excluded from statistics
+            total_library = await self.db.get_visible_library_count()
             logger.info(f"[get_tag_statistics] total_library (visible games): {total_library}")
 
-            # Count tags only for non-hidden games
-            visible_tags = 0
+            visible_counts = await self.db.get_tag_counts_visible()
             tag_counts = {
-                "completed": 0,
-                "in_progress": 0,
-                "mastered": 0,
-                "dropped": 0,
+                tag: visible_counts.get(tag, 0)
+                for tag in ("completed", "in_progress", "mastered", "dropped")
             }
-
-            for tag_entry in all_tags:
-                appid = tag_entry.get('appid')
-                # Check if this game is hidden
-                game_stats = await self.db.get_game_stats(appid)
-                if game_stats and game_stats.get('is_hidden'):
-                    continue  # Skip hidden games
-
-                tag_type = tag_entry.get('tag')
-                if tag_type in tag_counts:
-                    tag_counts[tag_type] += 1
-                    visible_tags += 1
+            visible_tags = sum(tag_counts.values())
 
             stats = {
                 **tag_counts,
@@ -524,19 +641,14 @@ class Plugin:
             logger.info(f"[get_tag_statistics] returning: {result}")
             return result
         except Exception as e:
-            logger.error(f"Error getting tag statistics: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"Error getting tag statistics: {e}")
             return {"success": False, "error": str(e)}
 
     async def log_frontend(self, level: str, message: str) -> Dict[str, bool]:
         """Log a message from the frontend to the backend log file"""
-        if level == "error":
-            logger.error(f"[FRONTEND] {message}")
-        elif level == "warn":
-            logger.warning(f"[FRONTEND] {message}")
-        else:
-            logger.info(f"[FRONTEND] {message}")
+        log_level = _FRONTEND_LOG_LEVELS.get(level, logging.INFO)
+        if logger.isEnabledFor(log_level):
+            logger.log(log_level, "[FRONTEND] %s", message)
         return {"success": True}
 
     async def get_sync_progress(self) -> Dict[str, Any]:
@@ -592,8 +704,8 @@ class Plugin:
                 achievement_percentage = None
 
             # Process the game
-            result = await Plugin.sync_game_with_playtime(
-                self, appid, playtime_minutes,
+            result = await self.sync_game_with_playtime(
+                appid, playtime_minutes,
                 total_achievements, unlocked_achievements, achievement_percentage,
                 game_name, rt_last_time_played
             )
@@ -612,9 +724,7 @@ class Plugin:
             }
 
         except Exception as e:
-            logger.error(f"sync_single_game_with_data failed for {params.get('appid')}: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"sync_single_game_with_data failed for {params.get('appid')}: {e}")
             return {"success": False, "error": str(e)}
 
     async def get_all_games(self) -> Dict[str, Any]:
@@ -628,26 +738,26 @@ class Plugin:
 
             logger.info(f"Game sources: installed={source_installed}, non_steam={source_non_steam}")
 
+            # Both service calls return freshly built lists, so the installed
+            # list is returned as-is and non-Steam games are appended to it
+            # rather than copying everything into a third list
             games = []
 
             # Get installed Steam games
             if source_installed:
-                installed_games = await self.steam_service.get_all_games()
-                games.extend(installed_games)
-                logger.info(f"Added {len(installed_games)} installed games")
+                games = await self.steam_service.get_all_games()
+                logger.info(f"Added {len(games)} installed games")
 
             # Get non-Steam games
             if source_non_steam:
                 non_steam_games = await self.steam_service.get_non_steam_games()
-                games.extend(non_steam_games)
+                games += non_steam_games
                 logger.info(f"Added {len(non_steam_games)} non-Steam games")
 
             logger.info(f"get_all_games: returning {len(games)} total games to frontend")
             return {"success": True, "games": games}
         except Exception as e:
-            logger.error(f"get_all_games failed: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"get_all_games failed: {e}")
             return {"success": False, "error": str(e)}
 
     async def sync_library_with_playtime(self, playtime_data_or_params: Dict[str, Any], achievement_data: Dict[str, Dict[str, int]] = None) -> Dict[str, Any]:
@@ -662,28 +772,34 @@ class Plugin:
             achievement_data = playtime_data_or_params.get('achievement_data', {})
             game_names = playtime_data_or_params.get('game_names', {})
         elif isinstance(playtime_data_or_params, dict) and 'playtime_data' in playtime_data_or_params:
-            # Backwards compatibility: convert old playtime_data format to game_data format
-            playtime_data = playtime_data_or_params.get('playtime_data', {})
-            game_data = {appid: {"playtime_minutes": mins, "rt_last_time_played": None}
-                        for appid, mins in playtime_data.items()}
+            # Backwards compatibility: old playtime_data format maps appid -> minutes,
+            # which sync_one below accepts as-is
+            game_data = playtime_data_or_params.get('playtime_data', {})
             achievement_data = playtime_data_or_params.get('achievement_data', {})
             game_names = playtime_data_or_params.get('game_names', {})
         else:
-            # Direct params (backwards compatibility)
-            playtime_data = playtime_data_or_params
-            game_data = {appid: {"playtime_minutes": mins, "rt_last_time_played": None}
-                        for appid, mins in playtime_data.items()}
+            # Direct params (backwards compatibility): appid -> minutes
+            game_data = playtime_data_or_params
             if achievement_data is None:
                 achievement_data = {}
             game_names = {}
 
+        # Appids are looked up as strings throughout (DB rows, shortcuts,
+        # cross-references between these maps); normalize once here so an
+        # int-keyed caller can't miss every lookup
+        game_data = {str(k): v for k, v in (game_data or {}).items()}
+        achievement_data = {str(k): v for k, v in (achievement_data or {}).items()}
+        game_names = {str(k): v for k, v in (game_names or {}).items()}
+
         try:
             logger.info(f"=== Starting sync with {len(game_data)} game entries ===")
 
+            # A full sync is the point to pick up library folder changes
+            self.steam_service.refresh()
+
             # Only sync games that were passed in game_data
             # This prevents single-game syncs from overwriting all other games with zeros
-            appids_to_sync = list(game_data.keys())
-            total = len(appids_to_sync)
+            total = len(game_data)
             synced = 0
             new_tags = 0  # Track newly tagged games for notifications
             errors = 0
@@ -694,72 +810,115 @@ class Plugin:
             self.sync_current = 0
             self.sync_total = total
 
-            hltb_requests = 0  # Track HLTB API requests for rate limiting
-
-            for i, appid in enumerate(appids_to_sync):
-                # Get game name from frontend (works for uninstalled games!)
-                game_name = game_names.get(appid, None)
-
-                # Extract game data from new structure
-                game_info = game_data.get(appid, {})
-                if isinstance(game_info, dict):
-                    playtime_minutes = int(game_info.get('playtime_minutes', 0))
-                    rt_last_time_played = game_info.get('rt_last_time_played')
-                elif isinstance(game_info, (int, float)):
-                    # Backwards compatibility: if old format passes just int/float
-                    playtime_minutes = int(game_info)
-                    rt_last_time_played = None
-                else:
-                    logger.warning(f"Unexpected game_info type for {appid}: {type(game_info)} = {game_info}")
-                    playtime_minutes = 0
-                    rt_last_time_played = None
-
-                # Get achievement data from frontend (None if not available)
-                # We only pass data if we have actual achievement info (total > 0)
-                # Otherwise pass None to preserve existing DB values
-                game_achievements = achievement_data.get(appid)
-                if isinstance(game_achievements, dict) and game_achievements.get('total', 0) > 0:
-                    total_achievements = game_achievements.get('total')
-                    unlocked_achievements = game_achievements.get('unlocked', 0)
-                    achievement_percentage = game_achievements.get('percentage', 0.0)
-                else:
-                    # No achievement data from frontend - pass None to preserve existing
-                    total_achievements = None
-                    unlocked_achievements = None
-                    achievement_percentage = None
-
-                # Log progress every 50 games to reduce log spam
-                if i % 50 == 0 or i == total - 1:
-                    logger.info(f"[{i+1}/{total}] Progress: syncing game {appid} ({game_name or 'unknown'})")
-
-                try:
-                    # Check if we need to fetch HLTB (no cache and has playtime)
-                    cached_hltb = await self.db.get_hltb_cache(appid)
-                    needs_hltb = not cached_hltb and playtime_minutes > 0
-
-                    result = await Plugin.sync_game_with_playtime(self, appid, playtime_minutes, total_achievements, unlocked_achievements, achievement_percentage, game_name, rt_last_time_played)
-                    synced += 1
-
-                    # Update sync progress
-                    self.sync_current = i + 1
-
-                    # Track if this game got a new/changed tag
-                    if result.get('tag_changed'):
-                        new_tags += 1
+            # Load existing tags, stats and HLTB data for every game up front
+            # instead of three lookups per game
+            appids = list(game_data)
+            current_tags, existing_stats, cached_hltb = await asyncio.gather(
+                self.db.get_tags_many(appids),
+                self.db.get_game_stats_many(appids),
+                self.db.get_hltb_cache_many(appids)
+            )
 
-                    # Only add delay when we actually made an HLTB request
-                    if needs_hltb:
-                        hltb_requests += 1
-                        # Rate limit: delay every 5 HLTB requests
-                        if hltb_requests % 5 == 0:
-                            await asyncio.sleep(1.0)
+            # Stats, HLTB rows and new auto tags are collected here and
+            # written in batches
+            deferred_writes = {"stats": [], "hltb": [], "tags": []}
+
+            async def write_deferred():
+                nonlocal synced, new_tags, errors
+
+                stats_rows, deferred_writes["stats"] = deferred_writes["stats"], []
+                hltb_rows, deferred_writes["hltb"] = deferred_writes["hltb"], []
+                tag_rows, deferred_writes["tags"] = deferred_writes["tags"], []
+                # One transaction (one commit) per chunk of games. Tags are
+                # queued only once the stats they were computed from are in
+                if await self.db.apply_sync_batch(stats_rows, hltb_rows):
+                    for appid, tag in tag_rows:
+                        await self.db.queue_tag(appid, tag, is_manual=False)
+                    return
+
+                # The chunk was rolled back, so none of its games were saved
+                synced -= len(stats_rows)
+                new_tags -= len(tag_rows)
+                errors += len(stats_rows)
+                error_list.extend(
+                    {"appid": appid, "error": "Failed to save sync results"} for appid, _ in stats_rows
+                )
+
+            # Games are synced by a bounded pool of concurrent workers. HLTB
+            # requests are paced inside HLTBService, so no sleeps are needed here
+            worker_sem = asyncio.Semaphore(SYNC_CONCURRENCY)
+
+            async def sync_one(i: int, appid: str, game_info: Any):
+                nonlocal synced, new_tags, errors
 
-                except Exception as e:
-                    errors += 1
-                    error_list.append({"appid": appid, "error": str(e)})
-                    logger.error(f"[{i+1}/{total}] Failed: {game_name} - {e}")
-                    # Update progress even on error
-                    self.sync_current = i + 1
+                # Get game name from frontend (works for uninstalled games!)
+                game_name = game_names.get(appid)
+
+                async with worker_sem:
+                    # Log progress every 50 games to reduce log spam
+                    if i % 50 == 0 or i == total - 1:
+                        logger.info(f"[{i+1}/{total}] Progress: syncing game {appid} ({game_name or 'unknown'})")
+
+                    try:
+                        # Extract game data from new structure
+                        if isinstance(game_info, dict):
+                            playtime_minutes = int(game_info.get('playtime_minutes', 0))
+                            rt_last_time_played = game_info.get('rt_last_time_played')
+                        elif isinstance(game_info, (int, float, str)):
+                            # Backwards compatibility: old playtime_data payloads map
+                            # appid -> minutes, sometimes sent as a string
+                            playtime_minutes = int(game_info)
+                            rt_last_time_played = None
+                        else:
+                            logger.warning(f"Unexpected game_info type for {appid}: {type(game_info)} = {game_info}")
+                            playtime_minutes = 0
+                            rt_last_time_played = None
+
+                        # Get achievement data from frontend (None if not available)
+                        # We only pass data if we have actual achievement info (total > 0)
+                        # Otherwise pass None to preserve existing DB values
+                        game_achievements = achievement_data.get(appid)
+                        if isinstance(game_achievements, dict) and game_achievements.get('total', 0) > 0:
+                            total_achievements = game_achievements.get('total')
+                            unlocked_achievements = game_achievements.get('unlocked', 0)
+                            achievement_percentage = game_achievements.get('percentage', 0.0)
+                        else:
+                            # No achievement data from frontend - pass None to preserve existing
+                            total_achievements = None
+                            unlocked_achievements = None
+                            achievement_percentage = None
+
+                        prefetched = {
+                            "tag": current_tags.get(appid),
+                            "stats": existing_stats.get(appid),
+                            "hltb": cached_hltb.get(appid)
+                        }
+                        result = await self.sync_game_with_playtime(
+                            appid, playtime_minutes, total_achievements, unlocked_achievements,
+                            achievement_percentage, game_name, rt_last_time_played,
+                            prefetched=prefetched, deferred_writes=deferred_writes
+                        )
+                        synced += 1
+
+                        # Track if this game got a new/changed tag
+                        if result.get('tag_changed'):
+                            new_tags += 1
+
+                        if len(deferred_writes["stats"]) >= SYNC_WRITE_BATCH:
+                            await write_deferred()
+
+                    except Exception as e:
+                        errors += 1
+                        error_list.append({"appid": appid, "error": str(e)})
+                        logger.error(f"[{i+1}/{total}] Failed: {game_name} - {e}")
+
+                    # Update sync progress (also on error)
+                    self.sync_current += 1
+
+            await asyncio.gather(*(
+                sync_one(i, appid, game_info) for i, (appid, game_info) in enumerate(game_data.items())
+            ))
+            await write_deferred()
 
             logger.info(f"Library sync completed: {synced}/{total} synced, {new_tags} new tags, {errors} errors")
 
@@ -778,47 +937,69 @@ class Plugin:
             }
 
         except Exception as e:
-            logger.error(f"sync_library_with_playtime failed: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"sync_library_with_playtime failed: {e}")
             # Clear sync progress on error
             self.sync_in_progress = False
             self.sync_current = 0
             self.sync_total = 0
             return {"success": False, "error": str(e)}
 
-    async def _fetch_game_name_from_steam_store(self, appid: str) -> Optional[str]:
-        """Fetch game name from Steam's store API (works for uninstalled games)"""
-        import urllib.request
-        import json as json_lib
-
+    def _fetch_game_name_from_steam_store_sync(self, appid: str) -> Optional[str]:
+        """Blocking Steam store lookup, run on a worker thread"""
         try:
-            url = f"https://store.steampowered.com/api/appdetails?appids={appid}"
-            req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
-            with urllib.request.urlopen(req, timeout=5) as response:
-                data = json_lib.loads(response.read().decode())
-                if data.get(str(appid), {}).get('success'):
-                    name = data[str(appid)]['data'].get('name')
-                    return name
+            _, body = self.store_http.request(
+                "GET", f"/api/appdetails?appids={appid}", headers={'User-Agent': 'Mozilla/5.0'}
+            )
+            data = json.loads(body)
+            if data.get(str(appid), {}).get('success'):
+                name = data[str(appid)]['data'].get('name')
+                return name
         except Exception as e:
             pass
 
         return None
 
-    async def sync_game_with_playtime(self, appid: str, playtime_minutes: int, total_achievements: int = None, unlocked_achievements: int = None, achievement_percentage: float = None, frontend_game_name: str = None, rt_last_time_played: int = None) -> Dict[str, Any]:
+    async def _fetch_game_name_from_steam_store(self, appid: str) -> Optional[str]:
+        """Fetch game name from Steam's store API (works for uninstalled games)"""
+        hit, name = _ttl_cache_get(self._store_name_cache, appid, STORE_NAME_CACHE_TTL)
+        if hit:
+            return name
+
+        # The request blocks for up to the 5s timeout, so keep it off the event loop
+        name = await asyncio.to_thread(self._fetch_game_name_from_steam_store_sync, appid)
+        # Only cache found names; a failed lookup may just be a network error
+        if name:
+            _ttl_cache_put(self._store_name_cache, appid, name)
+        return name
+
+    async def sync_game_with_playtime(self, appid: str, playtime_minutes: int, total_achievements: int = None, unlocked_achievements: int = None, achievement_percentage: float = None, frontend_game_name: str = None, rt_last_time_played: int = None,
+                                      prefetched: Optional[Dict[str, Any]] = None,
+                                      deferred_writes: Optional[Dict[str, list]] = None) -> Dict[str, Any]:
         """Sync a single game using frontend-provided playtime, achievements, name, and last played timestamp
 
         NOTE: Achievement params can be None if frontend doesn't have data.
         In that case, we preserve existing achievement data in DB.
+
+        prefetched holds the game's current "tag", "stats" and "hltb" rows when
+        the caller already loaded them in bulk. With deferred_writes, stats,
+        HLTB rows and a changed tag are appended to its "stats"/"hltb"/"tags"
+        lists for the caller to write in a batch instead of being written here.
         """
 
-        # Get current tag
-        current_tag = await self.db.get_tag(appid)
+        if prefetched is not None:
+            current_tag = prefetched["tag"]
+            existing_stats = prefetched["stats"]
+            cached_hltb = prefetched["hltb"]
+        else:
+            # Current tag, existing stats (to preserve achievement data if
+            # frontend doesn't have it) and cached HLTB data
+            current_tag, existing_stats, cached_hltb = await asyncio.gather(
+                self.db.get_tag(appid),
+                self.db.get_game_stats(appid),
+                self.db.get_hltb_cache(appid)
+            )
         is_manual = current_tag and current_tag.get('is_manual')
 
-        # Get existing stats to preserve achievement data if frontend doesn't have it
-        existing_stats = await self.db.get_game_stats(appid)
-
         # Use game name from frontend if provided (works for uninstalled games!)
         if frontend_game_name:
             game_name = frontend_game_name
@@ -827,34 +1008,31 @@ class Plugin:
             game_name = await self.steam_service.get_game_name(appid)
 
             # If still not found locally (uninstalled game), try Steam Store API
-            if not game_name or game_name.startswith('Unknown Game') or game_name.startswith('Game '):
-                store_name = await self._fetch_game_name_from_steam_store(appid)
-                if store_name:
-                    game_name = store_name
-                    logger.info(f"  Got name from Steam Store: {game_name}")
+            if not game_name:
+                game_name = await self._fetch_game_name_from_steam_store(appid)
+                if game_name:
+                    logger.debug("  Got name from Steam Store: %s", game_name)
+                else:
+                    game_name = f"Unknown Game ({appid})"
 
         # Check if this is a non-Steam game (appid > 2 billion = CRC32 hash)
-        try:
-            appid_int = int(appid)
-            is_non_steam = appid_int > 2000000000
-        except (ValueError, TypeError):
-            is_non_steam = False
+        is_non_steam = _is_non_steam_appid(appid)
 
         # Fetch HLTB if needed (do this before building stats so we can set is_hidden)
         # Retry HLTB lookup if:
         # 1. No cache exists at all
         # 2. Cache exists but has no main_story data (might have failed before)
-        cached_hltb = await self.db.get_hltb_cache(appid)
         should_fetch_hltb = not cached_hltb or not cached_hltb.get('main_story')
 
+        new_hltb = None
         if should_fetch_hltb:
-            logger.info(f"  Fetching HLTB for: {game_name} (cached={bool(cached_hltb)}, has_main_story={cached_hltb.get('main_story') if cached_hltb else None})")
+            logger.debug("  Fetching HLTB for: %s (cached=%s, has_main_story=%s)",
+                         game_name, bool(cached_hltb), cached_hltb.get('main_story') if cached_hltb else None)
             hltb_data = await self.hltb_service.search_game(game_name)
             if hltb_data and hltb_data.get('main_story'):
                 # Only cache if we got actual completion time data
-                await self.db.cache_hltb_data(appid, hltb_data)
-                cached_hltb = hltb_data
-                logger.info(f"  HLTB cached: main_story={hltb_data.get('main_story')}h")
+                new_hltb = cached_hltb = hltb_data
+                logger.debug("  HLTB cached: main_story=%sh", hltb_data.get('main_story'))
 
         # Determine if this game should be hidden from library
         # Hide non-Steam apps that have no HLTB data (likely not real games: Discord, Chrome, etc.)
@@ -877,39 +1055,58 @@ class Plugin:
             "rt_last_time_played": rt_last_time_played  # Unix timestamp of last play
         }
 
-        await self.db.update_game_stats(appid, stats)
+        if deferred_writes is not None:
+            deferred_writes["stats"].append((appid, stats))
+            if new_hltb:
+                deferred_writes["hltb"].append((appid, new_hltb))
+        else:
+            await self.db.apply_sync_result(appid, stats, new_hltb)
 
-        logger.info(f"  Stats: playtime={playtime_minutes}min, " +
-                    f"achievements={final_unlocked_achievements}/{final_total_achievements}" +
-                    (f", HIDDEN (non-Steam app without HLTB)" if is_hidden else "") +
-                    (f", last_played={rt_last_time_played}" if rt_last_time_played else ""))
+        logger.debug("  Stats: playtime=%smin, achievements=%s/%s%s%s",
+                     playtime_minutes, final_unlocked_achievements, final_total_achievements,
+                     ", HIDDEN (non-Steam app without HLTB)" if is_hidden else "",
+                     f", last_played={rt_last_time_played}" if rt_last_time_played else "")
 
         if cached_hltb:
-            logger.info(f"  HLTB: main={cached_hltb.get('main_story')}h, extra={cached_hltb.get('main_extra')}h")
+            logger.debug("  HLTB: main=%sh, extra=%sh", cached_hltb.get('main_story'), cached_hltb.get('main_extra'))
         else:
-            logger.info(f"  HLTB: no data")
+            logger.debug("  HLTB: no data")
 
         # Calculate tag (but don't override manual tags or hidden games)
         tag_changed = False
 
         if is_manual:
-            logger.info(f"  Skipping tag calculation (manual override)")
+            logger.debug("  Skipping tag calculation (manual override)")
         elif is_hidden:
-            logger.info(f"  Skipping tag calculation (hidden non-Steam app)")
+            logger.debug("  Skipping tag calculation (hidden non-Steam app)")
         else:
-            # Calculate tag using centralized logic
-            calculated_tag = await Plugin.calculate_auto_tag(self, appid)
-            logger.info(f"  Calculated tag: {calculated_tag or 'none'}")
+            # Calculate tag using centralized logic, from the stats built
+            # above ({} tells it there is no HLTB data to look up)
+            calculated_tag = await self.calculate_auto_tag(appid, stats, cached_hltb or {})
+            logger.debug("  Calculated tag: %s", calculated_tag or 'none')
 
             # Apply calculated tag if it changed
             if calculated_tag:
                 current_tag_value = current_tag.get('tag') if current_tag else None
                 if calculated_tag != current_tag_value:
-                    await self.db.set_tag(appid, calculated_tag, is_manual=False)
-                    logger.info(f"  -> Tag set: {calculated_tag}")
+                    if deferred_writes is not None:
+                        deferred_writes["tags"].append((appid, calculated_tag))
+                    else:
+                        await self.db.queue_tag(appid, calculated_tag, is_manual=False)
+                    logger.debug("  -> Tag set: %s", calculated_tag)
                     tag_changed = True
 
-        result = await self.db.get_tag(appid) or {}
+        if tag_changed:
+            # The row being written, built here instead of read back
+            # (last_updated in SQLite's CURRENT_TIMESTAMP format)
+            result = {
+                "appid": appid,
+                "tag": calculated_tag,
+                "is_manual": False,
+                "last_updated": time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime())
+            }
+        else:
+            result = dict(current_tag) if current_tag else {}
         result['tag_changed'] = tag_changed
         return result
 
@@ -920,29 +1117,28 @@ class Plugin:
             all_tags = await self.db.get_all_tags()
             logger.info(f"[get_all_tags_with_names] all_tags count: {len(all_tags) if all_tags else 0}")
             if all_tags:
-                logger.info(f"[get_all_tags_with_names] all_tags sample (first 3): {all_tags[:3]}")
+                logger.debug("[get_all_tags_with_names] all_tags sample (first 3): %s", all_tags[:3])
+
+            # One query for every tagged game's stats instead of one per game
+            stats_map = await self.db.get_game_stats_many([tag_entry['appid'] for tag_entry in all_tags])
 
             result = []
             for tag_entry in all_tags:
-                logger.info(f"[get_all_tags_with_names] tag_entry: {tag_entry}")
+                logger.debug("[get_all_tags_with_names] tag_entry: %s", tag_entry)
                 appid = tag_entry['appid']
-                stats = await self.db.get_game_stats(appid)
-                logger.info(f"[get_all_tags_with_names] stats: {stats}")
+                stats = stats_map.get(appid)
+                logger.debug("[get_all_tags_with_names] stats: %s", stats)
 
                 # Skip hidden games UNLESS they have a manual tag
                 # (user explicitly tagged them, so they want to see them)
                 is_hidden = stats.get('is_hidden', False) if stats else False
                 is_manual = tag_entry.get('is_manual', False)
                 if is_hidden and not is_manual:
-                    logger.info(f"[get_all_tags_with_names] skipping hidden non-Steam app: {appid}")
+                    logger.debug("[get_all_tags_with_names] skipping hidden non-Steam app: %s", appid)
                     continue
 
                 game_name = stats.get('game_name') if stats else None
-                logger.info(f"[get_all_tags_with_names] game_name: {game_name}")
-
-                # If no name in stats, try to get it from Steam/shortcuts
-                if not game_name or game_name.startswith('Unknown Game') or game_name.startswith('Game '):
-                    game_name = await self.steam_service.get_game_name(appid)
+                logger.debug("[get_all_tags_with_names] game_name: %s", game_name)
 
                 result.append({
                     'appid': appid,
@@ -951,63 +1147,70 @@ class Plugin:
                     'is_manual': is_manual
                 })
 
-            # Sort by tag type, then by name
-            tag_order = {'completed': 0, 'mastered': 1, 'in_progress': 2, 'dropped': 3}
-            result.sort(key=lambda x: (tag_order.get(x['tag'], 99), x['game_name'].lower()))
+            # Games with no name in stats get one from Steam/shortcuts, all
+            # looked up together
+            await self._fill_missing_names(result)
+
+            # Sort by tag type, then by name (sort calls the key once per game)
+            result.sort(key=lambda x: (_TAG_SORT_ORDER.get(x['tag'], 99), x['game_name'].casefold()))
 
             logger.info(f"[get_all_tags_with_names] returning {len(result)} games")
             if result:
-                logger.info(f"[get_all_tags_with_names] result sample (first 3): {result[:3]}")
+                logger.debug("[get_all_tags_with_names] result sample (first 3): %s", result[:3])
             return {'success': True, 'games': result}
         except Exception as e:
-            logger.error(f"Error getting all tags with names: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"Error getting all tags with names: {e}")
             return {'success': False, 'error': str(e)}
 
+    async def _fill_missing_names(self, games: List[Dict[str, Any]]):
+        """Replace missing or placeholder game_name values in place
+
+        Names are resolved with one bulk lookup; games still unknown are
+        shown as "Unknown Game (<appid>)".
+        """
+        unnamed = [
+            game for game in games
+            if not game['game_name'] or game['game_name'].startswith(_PLACEHOLDER_NAME_PREFIXES)
+        ]
+        if not unnamed:
+            return
+
+        names = await self._get_real_names_cached([game['appid'] for game in unnamed])
+        for game in unnamed:
+            game['game_name'] = names.get(game['appid']) or f"Unknown Game ({game['appid']})"
+
     async def get_backlog_games(self) -> Dict[str, Any]:
         """Get all games without a tag (backlog games)"""
         logger.info("=== get_backlog_games called ===")
         try:
-            # Get all tagged appids
-            all_tags = await self.db.get_all_tags()
-            tagged_appids = set(tag['appid'] for tag in all_tags) if all_tags else set()
-            logger.info(f"[get_backlog_games] tagged_appids count: {len(tagged_appids)}")
-
-            # Get all games from stats (excluding hidden games)
-            all_game_stats = await self.db.get_all_game_stats(include_hidden=False)
-            logger.info(f"[get_backlog_games] all_game_stats count (visible only): {len(all_game_stats) if all_game_stats else 0}")
-
-            result = []
-            for game in all_game_stats:
-                appid = game['appid']
-                if appid not in tagged_appids:
-                    # Get game name
-                    stats = await self.db.get_game_stats(appid)
-                    game_name = stats.get('game_name') if stats else None
-
-                    # If no name in stats, try to get from Steam/shortcuts
-                    if not game_name or game_name.startswith('Unknown Game') or game_name.startswith('Game '):
-                        game_name = await self.steam_service.get_game_name(appid)
-
-                    result.append({
-                        'appid': appid,
-                        'game_name': game_name or f'Game {appid}',
-                        'tag': 'backlog',
-                        'is_manual': False
-                    })
-
-            # Sort by name
-            result.sort(key=lambda x: x['game_name'].lower())
+            # Untagged visible games, found by the database in one query
+            backlog = await self.db.get_backlog_games()
+            logger.info(f"[get_backlog_games] untagged visible games: {len(backlog)}")
+
+            result = [
+                {
+                    'appid': game['appid'],
+                    'game_name': game['game_name'],
+                    'tag': 'backlog',
+                    'is_manual': False
+                }
+                for game in backlog
+            ]
+
+            # If no name in stats, try to get from Steam/shortcuts
+            await self._fill_missing_names(result)
+
+            # Rows come back ordered by name; re-sorting is nearly free and
+            # places resolved names (and non-ASCII ones, which SQLite's
+            # LOWER leaves as-is) correctly
+            result.sort(key=lambda x: x['game_name'].casefold())
 
             logger.info(f"[get_backlog_games] returning {len(result)} games")
             if result:
-                logger.info(f"[get_backlog_games] result sample (first 3): {result[:3]}")
+                logger.debug("[get_backlog_games] result sample (first 3): %s", result[:3])
             return {'success': True, 'games': result}
         except Exception as e:
-            logger.error(f"Error getting backlog games: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"Error getting backlog games: {e}")
             return {'success': False, 'error': str(e)}
 
     async def check_dropped_games(self, days_threshold: int = 365) -> Dict[str, Any]:
@@ -1021,7 +1224,5 @@ class Plugin:
                 "message": f"Tagged {dropped_count} games as dropped"
             }
         except Exception as e:
-            logger.error(f"Manual dropped games check failed: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"Manual dropped games check failed: {e}")
             return {"success": False, "error": str(e)}